@@ -0,0 +1,47 @@
+"""
+Parsing time of a single big multi-document YAML file, like a `kubectl get -A -o yaml` dump, with a growing number
+of processes. The file is made of the manifests of data/examples, replicated.
+
+Run from the repository root with: python -m benchmarks.bench_document_splitter [copies]
+"""
+import os
+import sys
+import tempfile
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+
+from microkure.importer.document_splitter import read_data_from_large_file
+from microkure.utils.utils import is_yaml, read_data_from_file
+
+EXAMPLES_FOLDER = os.path.join(os.path.dirname(__file__), "..", "data", "examples")
+DEFAULT_COPIES = 200
+WORKERS = [2, 4, 8]
+
+
+def write_dump(f, copies):
+    for _ in range(copies):
+        for folder, _, fnames in os.walk(EXAMPLES_FOLDER):
+            for file in sorted(fnames):
+                if is_yaml(file):
+                    with open(os.path.join(folder, file)) as e:
+                        f.write(f"---\n{e.read()}\n")
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COPIES
+
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml") as f:
+        write_dump(f, copies)
+        f.flush()
+        print(f"{copies} copies of {EXAMPLES_FOLDER}, {os.path.getsize(f.name) / 2 ** 20:.1f} MB")
+
+        serial_time = timeit.timeit(lambda: read_data_from_file(f.name), number=1)
+        print(f"serial: {serial_time:.2f}s")
+        for workers in WORKERS:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                split_time = timeit.timeit(lambda: read_data_from_large_file(f.name, executor, workers), number=1)
+            print(f"{workers} worker(s): {split_time:.2f}s ({serial_time / split_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark of the KubeObject representation on a 10k-object cluster: memory used by the object instances (excluding
+their manifest data) and time spent reading the identity fields, compared with the previous __dict__-based objects
+which re-derived them on every access.
+
+Run from the repository root with: python -m benchmarks.bench_kube_object
+"""
+import timeit
+import tracemalloc
+
+from microkure.kmodel.kube_cluster import KubeCluster
+from microkure.kmodel.kube_workload import KubeDeployment
+
+OBJECTS = 10000
+REPETITIONS = 20
+
+
+class DictKubeObject:
+    DEFAULT_NAMESPACE = "default"
+
+    def __init__(self, data: dict):
+        # The same per-object state as KubeDeployment, apart from the caches
+        self.data: dict = data
+        self.shortname = "deploy"
+        self.export_filename = None
+        self.dirty = False
+        self._cluster = None
+        self._containers = None
+
+    @property
+    def name(self):
+        return self.data.get("metadata", {}).get("name", "")
+
+    @property
+    def namespace(self):
+        return self.data.get("metadata", {}).get("namespace", self.DEFAULT_NAMESPACE)
+
+    @property
+    def fullname(self):
+        return f"{self.name}.{self.namespace}"
+
+    @property
+    def typed_fullname(self):
+        return f"{self.fullname}.{self.shortname}"
+
+
+def build_data():
+    return [{"kind": "Deployment", "metadata": {"name": f"deploy-{i}", "namespace": f"ns-{i % 10}"},
+             "spec": {"template": {"metadata": {}, "spec": {"containers": []}}}} for i in range(OBJECTS)]
+
+
+def measure_memory(kind, data):
+    tracemalloc.start()
+    objects = [kind(d) for d in data]
+    instances_size, _ = tracemalloc.get_traced_memory()
+    for o in objects:
+        o.typed_fullname  # Fill identity caches, when the representation has them
+    total_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objects, instances_size, total_size - instances_size
+
+
+def read_identities(objects):
+    for o in objects:
+        o.name, o.namespace, o.fullname, o.typed_fullname
+
+
+def main():
+    data = build_data()
+
+    dict_objects, dict_size, _ = measure_memory(DictKubeObject, data)
+    slot_objects, slot_size, cache_size = measure_memory(KubeDeployment, data)
+
+    print(f"{OBJECTS} objects")
+    print(f"__dict__ objects: {dict_size / OBJECTS:.0f} bytes/object")
+    print(f"slotted objects:  {slot_size / OBJECTS:.0f} bytes/object, "
+          f"plus {cache_size / OBJECTS:.0f} bytes/object of cached identity strings "
+          f"({(slot_size + cache_size) / OBJECTS:.0f} bytes/object in total)")
+
+    dict_time = timeit.timeit(lambda: read_identities(dict_objects), number=REPETITIONS)
+    slot_time = timeit.timeit(lambda: read_identities(slot_objects), number=REPETITIONS)
+    print(f"identity reads, __dict__ objects: {dict_time:.4f}s")
+    print(f"identity reads, slotted objects:  {slot_time:.4f}s ({dict_time / slot_time:.1f}x)")
+
+    cluster = KubeCluster()
+    add_time = timeit.timeit(lambda: [cluster.add_object(o) for o in slot_objects], number=1)
+    lookup_time = timeit.timeit(lambda: [cluster.get_object_by_name(o.typed_fullname) for o in slot_objects], number=1)
+    print(f"cluster build: {add_time:.4f}s, {OBJECTS} get_object_by_name lookups: {lookup_time:.4f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark of YamlKImporter with a growing number of parsing processes, on the manifests of data/examples replicated
+to a realistic repository size.
+
+Run from the repository root with: python -m benchmarks.bench_parallel_import [copies]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+from microkure.importer.yamlkimporter import YamlKImporter
+
+EXAMPLES_FOLDER = "./data/examples"
+DEFAULT_COPIES = 100
+WORKERS = [1, 2, 4, 8]
+
+
+def replicate_examples(destination, copies):
+    for i in range(copies):
+        shutil.copytree(EXAMPLES_FOLDER, os.path.join(destination, f"copy-{i}"))
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COPIES
+
+    with tempfile.TemporaryDirectory() as folder:
+        replicate_examples(folder, copies)
+        file_count = sum(len(files) for _, _, files in os.walk(folder))
+        print(f"{copies} copies of {EXAMPLES_FOLDER}, {file_count} files")
+
+        serial_time = None
+        for workers in WORKERS:
+            import_time = timeit.timeit(lambda: YamlKImporter(workers=workers).Import(folder), number=1)
+            serial_time = serial_time or import_time
+            print(f"{workers} worker(s): {import_time:.2f}s ({serial_time / import_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Micro-benchmark of KubeService port matching: a service with many ports checked against a workload with many
+containers, comparing the previous nested-loop implementation with the precomputed port keys.
+
+Run from the repository root with: python -m benchmarks.bench_port_matching
+"""
+import timeit
+
+from microkure.kmodel.kube_networking import KubeService
+from microkure.kmodel.kube_workload import KubeDeployment
+
+SERVICE_PORTS = 200
+CONTAINERS = 50
+PORTS_PER_CONTAINER = 20
+REPETITIONS = 50
+
+
+def nested_loop_match(service, ports_to_check):
+    for svc_port in service.ports:
+        for w_port in ports_to_check:
+            port_to_consider = svc_port.get("targetPort", svc_port.get("port", None))
+            target_port_match = \
+                port_to_consider == w_port.get("name", "") or \
+                port_to_consider == w_port.get("containerPort", "")
+
+            protocol_match = svc_port.get("protocol", "TCP") == w_port.get("protocol", "TCP")
+
+            if target_port_match and protocol_match:
+                return True
+    return False
+
+
+def build_service():
+    ports = [{"name": f"svc-{i}", "port": 80 + i, "targetPort": 10000 + i, "protocol": "TCP"}
+             for i in range(SERVICE_PORTS)]
+    return KubeService({"kind": "Service", "metadata": {"name": "bench-svc"}, "spec": {"ports": ports}})
+
+
+def build_workload():
+    containers = [
+        {"name": f"container-{c}",
+         "ports": [{"name": f"c{c}-p{p}", "containerPort": 20000 + c * PORTS_PER_CONTAINER + p}
+                   for p in range(PORTS_PER_CONTAINER)]}
+        for c in range(CONTAINERS)
+    ]
+    return KubeDeployment({"kind": "Deployment", "metadata": {"name": "bench-deploy"},
+                           "spec": {"template": {"metadata": {}, "spec": {"containers": containers}}}})
+
+
+def main():
+    service = build_service()
+    workload = build_workload()
+    containers = workload.containers
+
+    # Worst case: no port matches, so every pair has to be considered
+    nested = timeit.timeit(lambda: [nested_loop_match(service, c.ports) for c in containers], number=REPETITIONS)
+    keyed = timeit.timeit(lambda: [service.does_match_container(c) for c in containers], number=REPETITIONS)
+
+    print(f"{SERVICE_PORTS} service ports vs {CONTAINERS} containers x {PORTS_PER_CONTAINER} ports, "
+          f"{REPETITIONS} repetitions")
+    print(f"nested loop: {nested:.4f}s")
+    print(f"port keys:   {keyed:.4f}s ({nested / keyed:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
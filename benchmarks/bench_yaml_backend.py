@@ -0,0 +1,53 @@
+"""
+Throughput of the pure-Python and libyaml (C) YAML backends when loading and dumping the manifests of data/examples,
+replicated to a realistic repository size.
+
+Run from the repository root with: python -m benchmarks.bench_yaml_backend [copies]
+"""
+import os
+import sys
+import timeit
+
+import yaml
+
+from microkure.utils.utils import dump_yaml, is_yaml
+
+EXAMPLES_FOLDER = "./data/examples"
+DEFAULT_COPIES = 20
+
+
+def read_examples():
+    contents = []
+    for folder, _, fnames in os.walk(EXAMPLES_FOLDER):
+        for file in sorted(fnames):
+            if is_yaml(file):
+                with open(os.path.join(folder, file)) as f:
+                    contents.append(f.read())
+    return contents
+
+
+def load(contents, loader):
+    return [d for content in contents for d in yaml.load_all(content, Loader=loader) if d is not None]
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COPIES
+    contents = read_examples() * copies
+    size_mb = sum(len(c) for c in contents) / 2 ** 20
+    print(f"{copies} copies of {EXAMPLES_FOLDER}: {len(contents)} files, {size_mb:.1f} MB")
+
+    if not yaml.__with_libyaml__:
+        print("PyYAML has not been built against libyaml, only the pure-Python backend is available")
+        return
+
+    for name, loader, dumper in [("pure-Python", yaml.SafeLoader, yaml.SafeDumper),
+                                 ("libyaml", yaml.CSafeLoader, yaml.CSafeDumper)]:
+        documents = []
+        load_time = timeit.timeit(lambda: documents.extend(load(contents, loader)), number=1)
+        dump_time = timeit.timeit(lambda: [dump_yaml(d, dumper) for d in documents], number=1)
+        print(f"{name}: load {size_mb / load_time:.2f} MB/s ({load_time:.2f}s), "
+              f"dump {len(documents) / dump_time:.0f} documents/s ({dump_time:.2f}s)")
+
+
+if __name__ == '__main__':
+    main()
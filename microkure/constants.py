@@ -1,13 +1,30 @@
 from datetime import datetime
 
+RUN_NAME = datetime.now().strftime('%Y%m%d_%H%M%S')
 
-OUTPUT_FOLDER = f"./out/{datetime.now().strftime('%Y%m%d_%H%M%S')}/"
 
-REPORT_OUTPUT_FOLDER = f"{OUTPUT_FOLDER}/report"
-DEPLOY_OUTPUT_FOLDER = f"{OUTPUT_FOLDER}/deploy"
-TOSCA_OUTPUT_FOLDER = f"{OUTPUT_FOLDER}/microtosca"
+def set_output_root(output_root: str, staging: bool = False):
+    """
+    Set the folder where the output folder of the run is created. With staging, the output is written to a hidden
+    staging folder, to be renamed to PUBLISHED_OUTPUT_FOLDER only once complete (see utils.publish_folder). Output
+    folders must be read from this module after this call (e.g. constants.DEPLOY_OUTPUT_FOLDER), not imported by name.
+    """
+    global OUTPUT_ROOT, PUBLISHED_OUTPUT_FOLDER, OUTPUT_FOLDER, REPORT_OUTPUT_FOLDER, DEPLOY_OUTPUT_FOLDER, \
+        TOSCA_OUTPUT_FOLDER, OVERLAY_OUTPUT_FOLDER, GENERATED_DEPLOY_OUTPUT_FOLDER
 
-GENERATED_DEPLOY_OUTPUT_FOLDER = f"{DEPLOY_OUTPUT_FOLDER}/auto_generated"
+    OUTPUT_ROOT = output_root
+    PUBLISHED_OUTPUT_FOLDER = f"{OUTPUT_ROOT}/{RUN_NAME}"
+    OUTPUT_FOLDER = f"{OUTPUT_ROOT}/.{RUN_NAME}.staging/" if staging else f"{PUBLISHED_OUTPUT_FOLDER}/"
+
+    REPORT_OUTPUT_FOLDER = f"{OUTPUT_FOLDER}/report"
+    DEPLOY_OUTPUT_FOLDER = f"{OUTPUT_FOLDER}/deploy"
+    TOSCA_OUTPUT_FOLDER = f"{OUTPUT_FOLDER}/microtosca"
+    OVERLAY_OUTPUT_FOLDER = f"{OUTPUT_FOLDER}/overlay"
+
+    GENERATED_DEPLOY_OUTPUT_FOLDER = f"{DEPLOY_OUTPUT_FOLDER}/auto_generated"
+
+
+set_output_root("./out")
 
 # The path of the ignore config json schema
 IGNORE_CONFIG_SCHEMA_FILE = "./schema/ignore_config_schema.json"
@@ -1,44 +1,202 @@
 import os
-import shutil
+from itertools import groupby
 
 import yaml
 
-from microkure.constants import DEPLOY_OUTPUT_FOLDER, GENERATED_DEPLOY_OUTPUT_FOLDER
+from microkure import constants
+from microkure.importer.document_reference import DocumentReference
 from microkure.kmodel.kube_object import KubeObject
-from microkure.utils.utils import create_folder
+from microkure.kmodel.kube_object_factory import KubeObjectFactory
+from microkure.utils.output_index import write_output, copy_output
+from microkure.utils.utils import dump_yaml, dump_json, is_json, get_document_spans, json_loads, COPY
+
+YAML_SEPARATOR = "\n---\n\n"
+
+
+class SourceDocuments:
+    """The source file of a set of exported objects, with the position of their documents and whether they changed."""
+
+    def __init__(self, path: str, document_indexes: list, modified: list):
+        self.path = path
+        self.document_indexes = document_indexes
+        self.modified = modified
 
 
 class ExportObject:
 
-    def __init__(self, kube_object, filename):
+    def __init__(self, kube_object, filename, source_path=None, document_index=None):
         self.kube_object = kube_object
         self.filename = filename
+        self.source_path = source_path  # The file the object has been imported from, if any
+        self.document_index = document_index  # The position of the object's document in its source file, if any
         self.out_fullname = self._get_output_fullname()
 
-    def export(self):
-        create_folder(self.out_fullname)
+    @property
+    def is_modified(self) -> bool:
+        if self.source_path is None:
+            return True
+        return isinstance(self.kube_object, KubeObject) and self.kube_object.dirty
 
-        if self.kube_object is None:
-            shutil.copy(self.filename, self.out_fullname)
-        elif isinstance(self.kube_object, dict) or isinstance(self.kube_object, KubeObject):
-            self._write_to_file()
+    @property
+    def content(self):
+        if isinstance(self.kube_object, KubeObject):
+            return self.kube_object.data
+        elif isinstance(self.kube_object, DocumentReference):
+            return self.kube_object.load()
+        else:
+            return self.kube_object
 
     def _get_output_fullname(self):
         if self.filename:
-            return f"{DEPLOY_OUTPUT_FOLDER}/{self.filename}"
+            return f"{constants.DEPLOY_OUTPUT_FOLDER}/{self.filename}"
         else:
-            return f"{GENERATED_DEPLOY_OUTPUT_FOLDER}/{self.kube_object.typed_fullname}.yaml"
+            return f"{constants.GENERATED_DEPLOY_OUTPUT_FOLDER}/{self.kube_object.typed_fullname}.yaml"
+
+
+def group_by_file(export_objects) -> dict:
+    """Group the objects by output file, keeping the order of the objects and of the files."""
+    files = {}
+    for export_obj in export_objects:
+        files.setdefault(export_obj.out_fullname, []).append(export_obj)
+    return files
+
+
+def write_file(export_objects: list, preserve_source: bool = False, link_mode: str = COPY):
+    """Write all the objects exported to the same file at once. The folder of the file must exist."""
+    first = export_objects[0]
+
+    if first.kube_object is None:
+        copy_output(first.source_path or first.filename, first.out_fullname, link_mode)
+    else:
+        write_contents(first.out_fullname, *contents_and_source(export_objects, preserve_source))
+
+
+def write_contents(out_fullname: str, contents: list, source: SourceDocuments = None):
+    content = serialize_contents(out_fullname, contents, source)
+    if content:
+        write_output(out_fullname, content)
+
+
+def file_content(export_objects: list, preserve_source: bool = False) -> str:
+    return serialize_contents(export_objects[0].out_fullname, *contents_and_source(export_objects, preserve_source))
+
+
+def serialize_contents(out_fullname: str, contents: list, source: SourceDocuments = None) -> str:
+    """
+    Serialize the documents of an output file. If the source of a JSON file is given, the documents are put back in
+    its List wrappers, otherwise they are wrapped in a v1 List if they are more than one. If the source of a YAML file
+    is given, its unmodified documents are copied from it as they are.
+    """
+    if is_json(out_fullname):
+        content = _wrap_json(contents, source) if source else None
+        if content is None:
+            content = contents[0] if len(contents) == 1 else {"apiVersion": "v1", "kind": "List", "items": contents}
+        return dump_json(content)
+
+    if source:
+        content = _patch_source(contents, source)
+        if content is not None:
+            return content
+
+    return _dump_documents(contents)
 
-    def _write_to_file(self):
-        YAML_SEPARATOR = "\n---\n\n"
 
-        content = self.kube_object.data if isinstance(self.kube_object, KubeObject) else self.kube_object
+def contents_and_source(export_objects: list, preserve_source: bool) -> tuple:
+    """
+    Return the arguments of serialize_contents() for the objects exported to the same file. The source of JSON files
+    is always returned, as their List wrappers are taken from it.
+    """
+    first = export_objects[0]
+    if (preserve_source or is_json(first.out_fullname)) and first.source_path and \
+            os.path.isfile(first.source_path) and \
+            all(e.source_path == first.source_path and e.document_index is not None for e in export_objects):
+        source = SourceDocuments(first.source_path, [e.document_index for e in export_objects],
+                                 [e.is_modified for e in export_objects])
+    else:
+        source = None
+    return [export_obj.content for export_obj in export_objects], source
 
-        if isinstance(content, dict):
-            c = yaml.dump(content, sort_keys=False)
 
-            file_exists = os.path.exists(self.out_fullname)
-            with open(self.out_fullname, "a" if file_exists else "w") as f:
-                if file_exists:
-                    f.write(YAML_SEPARATOR)
-                f.write(c)
+def _dump_documents(contents: list) -> str:
+    return YAML_SEPARATOR.join(dump_yaml(content) for content in contents if isinstance(content, dict))
+
+
+def _wrap_json(contents: list, source: SourceDocuments):
+    """
+    Rebuild a JSON file from its source, replacing its objects with their content and keeping the List wrappers they
+    were flattened from. Return None if the source cannot be parsed.
+    """
+    try:
+        with open(source.path, "rb") as f:
+            original = json_loads(f.read())
+    except ValueError:
+        return None
+
+    documents = original if isinstance(original, list) else [original]
+    indexes = source.document_indexes
+    if any(index >= len(documents) for index in indexes) or indexes != sorted(indexes):
+        return None
+
+    wrapped = []
+    for index, items in groupby(zip(indexes, contents), key=lambda d: d[0]):
+        items = [content for _, content in items]
+        document = documents[index]
+        if len(items) == len(KubeObjectFactory.flatten([document])):
+            wrapped.append(_replace_items(document, items))
+        elif isinstance(document, dict) and KubeObjectFactory.is_list(document.get("kind")):
+            # Objects have been removed, the items of nested Lists are no longer matched and are put in the outer one
+            wrapped.append({**document, "items": items})
+        else:
+            return None
+
+    return wrapped if isinstance(original, list) else wrapped[0]
+
+
+def _replace_items(document, items: list):
+    # Replace the objects of a document, in the order in which they have been flattened, with the next items
+    if isinstance(document, dict) and KubeObjectFactory.is_list(document.get("kind")) \
+            and isinstance(document.get("items"), list):
+        return {**document, "items": [_replace_items(item, items) for item in document["items"]]}
+    return items.pop(0)
+
+
+def _patch_source(contents: list, source: SourceDocuments):
+    """
+    Rebuild the file from its source, copying the text of the unmodified documents as it is and dumping only the
+    modified ones. Return None if the documents cannot be matched with the source.
+    """
+    with open(source.path) as f:
+        text = f.read()
+
+    try:
+        spans = get_document_spans(text)
+    except yaml.YAMLError:
+        return None
+
+    indexes = source.document_indexes
+    if any(index >= len(spans) for index in indexes) or indexes != sorted(indexes):
+        return None
+
+    # The text preceding the first document (e.g. comments) is kept only if the document is kept
+    chunks = [text[:spans[0][0]] if indexes[0] == 0 else ""]
+    previous = None
+    for index, documents in groupby(zip(indexes, source.modified, contents), key=lambda d: d[0]):
+        documents = list(documents)
+        start, end = spans[index]
+
+        # The text between a document and the following one in the source, with its document marker
+        if previous is not None:
+            chunks.append(text[spans[previous][1]:spans[previous + 1][0]])
+
+        if any(modified for _, modified, _ in documents):
+            # A document not starting at the beginning of a line, like in "--- {a: b}", is dumped in a new line
+            new_line = "" if start == 0 or text[start - 1] == "\n" else "\n"
+            chunks.append(new_line + _dump_documents([content for _, _, content in documents]))
+        else:
+            chunks.append(text[start:end])
+        previous = index
+
+    if previous == len(spans) - 1:
+        chunks.append(text[spans[-1][1]:])
+    content = "".join(chunks)
+    return content if content.endswith("\n") else content + "\n"
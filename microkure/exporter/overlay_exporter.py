@@ -0,0 +1,161 @@
+import os
+
+from .export_object import ExportObject
+from .yamlkexporter import YamlKExporter
+from .. import constants
+from ..kmodel.kube_cluster import KubeCluster
+from ..kmodel.kube_object import KubeObject
+from ..kmodel.kube_object_factory import KubeObjectFactory
+from ..utils.output_index import write_output
+from ..utils.utils import create_folder, dump_yaml, is_json, read_data_from_file, read_data_from_json_file
+
+KUSTOMIZATION_FILES = ["kustomization.yaml", "kustomization.yml", "Kustomization"]
+
+
+class OverlayKExporter(YamlKExporter):
+    """
+    Exporter writing only the changes made to the cluster, as a kustomize overlay of the imported folder: new objects
+    are added as resources, modified objects are changed by JSON patches and removed objects are deleted by patches.
+    """
+
+    def __init__(self, base_path: str, workers: int = 1):
+        super().__init__(workers=workers)
+        self.base_path = base_path  # The imported folder
+
+    def _export_cluster(self, cluster: KubeCluster):
+        originals = self._read_originals(cluster.cluster_export_info + cluster.removed_export_info)
+        resources, patches = [], []
+        used_names = set()
+
+        for export_obj in cluster.cluster_export_info:
+            if export_obj.kube_object is None or not export_obj.is_modified:
+                continue
+
+            content = export_obj.content
+            original = originals.get(export_obj)
+            if original is None or _identity(original) != _identity(content):
+                # New objects, and renamed ones, are added as resources
+                if original is not None:
+                    patches.append(self._write_deletion(original, used_names))
+                resources.append(self._write(content, "resources", used_names))
+            else:
+                operations = json_patch(original, content)
+                if operations:
+                    patch_file = self._write(operations, "patches", used_names, content)
+                    patches.append({"path": patch_file, "target": _target(content)})
+
+        for export_obj in cluster.removed_export_info:
+            if export_obj in originals:
+                patches.append(self._write_deletion(originals[export_obj], used_names))
+
+        kustomization = {
+            "apiVersion": "kustomize.config.k8s.io/v1beta1",
+            "kind": "Kustomization",
+            "resources": self._base_resources(cluster) + resources,
+        }
+        if patches:
+            kustomization["patches"] = patches
+
+        create_folder(f"{constants.OVERLAY_OUTPUT_FOLDER}/kustomization.yaml")
+        write_output(f"{constants.OVERLAY_OUTPUT_FOLDER}/kustomization.yaml", dump_yaml(kustomization))
+
+    def _base_resources(self, cluster: KubeCluster) -> list:
+        # A folder can be a resource only if it is a kustomization itself, otherwise its manifest files are listed
+        if any(os.path.isfile(os.path.join(self.base_path, name)) for name in KUSTOMIZATION_FILES):
+            sources = [self.base_path]
+        else:
+            sources = dict.fromkeys(e.source_path for e in cluster.cluster_export_info + cluster.removed_export_info
+                                    if e.source_path and _is_manifest(e))
+        return [os.path.relpath(source, constants.OVERLAY_OUTPUT_FOLDER) for source in sources]
+
+    def _write_deletion(self, original: dict, used_names: set) -> dict:
+        deletion = {"apiVersion": original.get("apiVersion"), "kind": original.get("kind"),
+                    "metadata": {key: value for key, value in original.get("metadata", {}).items()
+                                 if key in ["name", "namespace"]},
+                    "$patch": "delete"}
+        return {"path": self._write(deletion, "deletions", used_names)}
+
+    def _write(self, content, folder: str, used_names: set, named_by: dict = None) -> str:
+        metadata = (named_by or content).get("metadata", {})
+        name = "-".join(filter(None, [(named_by or content).get("kind", "").lower(), metadata.get("namespace"),
+                                      metadata.get("name")]))
+
+        filename = f"{folder}/{name}.yaml"
+        count = 1
+        while filename in used_names:
+            count += 1
+            filename = f"{folder}/{name}-{count}.yaml"
+        used_names.add(filename)
+
+        out_fullname = f"{constants.OVERLAY_OUTPUT_FOLDER}/{filename}"
+        create_folder(out_fullname)
+        write_output(out_fullname, dump_yaml(content))
+        return filename
+
+    @staticmethod
+    def _read_originals(export_objects: list) -> dict[ExportObject, dict]:
+        """Read again from the source files the documents of the imported objects, as they were before any change."""
+        originals = {}
+        by_source = {}
+        for export_obj in export_objects:
+            if export_obj.kube_object is not None and export_obj.source_path and export_obj.document_index is not None:
+                by_source.setdefault(export_obj.source_path, []).append(export_obj)
+
+        for source_path, source_objects in by_source.items():
+            if not os.path.isfile(source_path):
+                continue
+            read_function = read_data_from_json_file if is_json(source_path) else read_data_from_file
+            documents = [KubeObjectFactory.flatten([document]) for document in read_function(source_path)]
+
+            # Objects flattened from the same List document are matched by position
+            for export_obj in sorted(source_objects, key=lambda e: e.document_index):
+                if export_obj.document_index < len(documents) and documents[export_obj.document_index]:
+                    originals[export_obj] = documents[export_obj.document_index].pop(0)
+
+        return originals
+
+
+def json_patch(original, current, path: str = "") -> list:
+    """Return the JSON patch (RFC 6902) operations changing original into current. Changed lists are replaced."""
+    if not isinstance(original, dict) or not isinstance(current, dict):
+        return [] if original == current else [{"op": "replace", "path": path, "value": current}]
+
+    operations = []
+    for key in original:
+        if key not in current:
+            operations.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+    for key, value in current.items():
+        if key not in original:
+            operations.append({"op": "add", "path": f"{path}/{_escape(key)}", "value": value})
+        elif original[key] != value:
+            operations += json_patch(original[key], value, f"{path}/{_escape(key)}")
+    return operations
+
+
+def _escape(key) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _is_manifest(export_obj: ExportObject) -> bool:
+    # Files without Kubernetes objects (e.g. a microTOSCA model) cannot be built by kustomize
+    if isinstance(export_obj.kube_object, KubeObject):
+        return True
+    if export_obj.kube_object is None:
+        return False
+    content = export_obj.content
+    return isinstance(content, dict) and bool(content.get("apiVersion")) and bool(content.get("kind")) and \
+        isinstance(content.get("metadata"), dict) and bool(content["metadata"].get("name"))
+
+
+def _identity(content: dict) -> tuple:
+    metadata = content.get("metadata", {})
+    return content.get("apiVersion"), content.get("kind"), metadata.get("name"), metadata.get("namespace")
+
+
+def _target(content: dict) -> dict:
+    api_version, kind, name, namespace = _identity(content)
+    group, _, version = api_version.rpartition("/") if api_version else ("", "", "")
+    target = {"group": group, "version": version, "kind": kind, "name": name}
+    if namespace:
+        target["namespace"] = namespace
+    return {key: value for key, value in target.items() if value}
@@ -1,28 +1,120 @@
+import multiprocessing
 import os.path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 
 from microfreshener.core.exporter import YMLExporter
 from microfreshener.core.model import MicroToscaModel
 
+from .export_object import group_by_file, write_file, file_content, contents_and_source, serialize_contents
 from .exporter import Exporter
-from ..constants import TOSCA_OUTPUT_FOLDER
+from .. import constants
 from ..kmodel.kube_cluster import KubeCluster
-from ..utils.utils import create_folder
+from ..utils.archive import ArchiveReader, ArchiveWriter, is_zip
+from ..utils.output_index import write_output, copy_output
+from ..utils.utils import create_folder, COPY
 
 
 class YamlKExporter(Exporter):
 
+    def __init__(self, only_modified: bool = False, source_archive: str = None, workers: int = 1,
+                 link_mode: str = COPY):
+        # If set, files whose objects have not been modified are copied from their source instead of being rewritten,
+        # and in the other files only the modified documents are rewritten
+        self.only_modified = only_modified
+
+        # If set, the cluster has been imported from this archive, and it is exported to an archive of the same type
+        self.source_archive = source_archive
+
+        # Number of processes used for serializing the Kubernetes files, files are serialized serially if 1
+        self.workers = workers
+
+        # How files exported as they are (files that are not Kubernetes files, and unmodified ones) are exported
+        self.link_mode = link_mode
+
     def export(self, cluster: KubeCluster, model: MicroToscaModel, tosca_model_filename=None):
-        # Export cluster
-        for export_obj in cluster.cluster_export_info:
-            export_obj.export()
+        if self.workers > 1:
+            # The model is exported while the Kubernetes files are serialized by the worker processes
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                model_export = executor.submit(self._export_model, model, tosca_model_filename)
+                self._export_cluster(cluster)
+                model_export.result()
+        else:
+            self._export_cluster(cluster)
+            self._export_model(model, tosca_model_filename)
 
-        # Export micro tosca model
+    def _export_cluster(self, cluster: KubeCluster):
+        if self.source_archive:
+            self._export_archive(cluster)
+        elif self.only_modified:
+            self._export_modified_files(cluster)
+        else:
+            self._export_objects(cluster.cluster_export_info)
+
+    def _export_model(self, model: MicroToscaModel, tosca_model_filename=None):
         tosca_model_str = YMLExporter().Export(model)
 
         filename = os.path.basename(tosca_model_filename) if tosca_model_filename else model.name+".yml"
-        tosca_output_filename = f"{TOSCA_OUTPUT_FOLDER}/{filename}"
+        tosca_output_filename = f"{constants.TOSCA_OUTPUT_FOLDER}/{filename}"
 
         create_folder(tosca_output_filename)
-        with open(tosca_output_filename, "w") as f:
-            f.write(tosca_model_str)
+        write_output(tosca_output_filename, tosca_model_str)
+
+    def _export_modified_files(self, cluster: KubeCluster):
+        self._export_objects(cluster.cluster_export_info, cluster)
+
+    def _export_objects(self, export_objects, cluster: KubeCluster = None):
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=_worker_context()) if self.workers > 1 \
+                else nullcontext() as executor:
+            writes = []
+
+            # Each output file is written at once, with all its documents, and each folder is created once
+            created_folders = set()
+            for out_fullname, file_objects in group_by_file(export_objects).items():
+                folder = os.path.dirname(out_fullname)
+                if folder not in created_folders:
+                    os.makedirs(folder, exist_ok=True)
+                    created_folders.add(folder)
+
+                if cluster and not cluster.is_file_modified(out_fullname):
+                    copy_output(file_objects[0].source_path, out_fullname, self.link_mode)
+                elif executor and file_objects[0].kube_object is not None:
+                    contents, source = contents_and_source(file_objects, preserve_source=cluster is not None)
+                    writes.append((out_fullname, executor.submit(serialize_contents, out_fullname, contents, source)))
+                else:
+                    write_file(file_objects, preserve_source=cluster is not None, link_mode=self.link_mode)
+
+            # Files are serialized by the processes, and written by this one through the output index, if any
+            for out_fullname, content in writes:
+                if content.result():
+                    write_output(out_fullname, content.result())
+
+    def _export_archive(self, cluster: KubeCluster):
+        files = {os.path.relpath(out_fullname, constants.DEPLOY_OUTPUT_FOLDER): file_objects
+                 for out_fullname, file_objects in group_by_file(cluster.cluster_export_info).items()}
+
+        extension = ".zip" if is_zip(self.source_archive) else ".tar.gz"
+        create_folder(constants.DEPLOY_OUTPUT_FOLDER + extension)
+
+        with ArchiveReader(self.source_archive) as source, ArchiveWriter(constants.DEPLOY_OUTPUT_FOLDER + extension) as target:
+            for file, size, stream in source.members():
+                export_objects = files.pop(file, None)
+
+                if export_objects is None:
+                    continue
+                elif export_objects[0].kube_object is None or \
+                        (self.only_modified and not cluster.is_file_modified(export_objects[0].out_fullname)):
+                    target.add_stream(file, size, stream)
+                else:
+                    target.add(file, file_content(export_objects).encode())
+
+            # Objects that do not come from the archive
+            for file, export_objects in files.items():
+                target.add(file, file_content(export_objects).encode())
+
 
+def _worker_context():
+    # Workers are not forked, since the model and the report are exported by threads running while the pool starts:
+    # a forked worker could inherit a lock (e.g. of logging) held by one of them and deadlock
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
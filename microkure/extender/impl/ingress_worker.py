@@ -28,7 +28,7 @@ class IngressWorker(KubeWorker):
 
     def _handle_ingress_in_model(self, model, cluster, ingress, ingress_node, not_ignored_mr):
         for exposed_svc in ingress.get_exposed_svc_names():
-            mr_node = model.get_node_by_name(exposed_svc, MessageRouter)
+            mr_node = self._get_svc_node(model, cluster, exposed_svc)
 
             if mr_node not in [r.target for r in ingress_node.interactions] and mr_node in not_ignored_mr:
                 model.add_interaction(source_node=ingress_node, target_node=mr_node)
@@ -50,6 +50,12 @@ class IngressWorker(KubeWorker):
                     model.edge.add_member(ingress_node)
                     model.add_interaction(source_node=ingress_node, target_node=mr_node)
 
+    def _get_svc_node(self, model, cluster, svc_name):
+        # Once renamed by the name worker, the node of a service is named after its typed fullname
+        k_service = cluster.get_object_by_name(svc_name, KubeService)
+        mr_node = model.get_node_by_name(k_service.typed_fullname, MessageRouter) if k_service else None
+        return mr_node or model.get_node_by_name(svc_name, MessageRouter)
+
     def _remove_mr_from_edge(self, model, cluster, node):
         if node in model.edge.members:
             k_service = cluster.get_object_by_name(node.name)
@@ -1,8 +1,8 @@
 from microkure.extender.kubeworker import KubeWorker
 from microkure.extender.worker_names import ISTIO_CIRCUIT_BREAKER, NAME_WORKER
 from microkure.ignorer.impl.ignore_nothing import IgnoreNothing
-from microkure.kmodel.shortnames import ALL_SHORTNAMES, KUBE_SERVICE
-from microkure.kmodel.utils import name_is_FQDN
+from microkure.kmodel.names import canonical_name, parse_name
+from microkure.kmodel.shortnames import KUBE_SERVICE
 
 
 class IstioCircuitBreakerWorker(KubeWorker):
@@ -28,10 +28,9 @@ class IstioCircuitBreakerWorker(KubeWorker):
                         r.set_circuit_breaker(True)
 
     def _adjust_host_name(self, name):
-        if name_is_FQDN(name):  # Name is name.namespace.shortname.cluster.local
-            return ".".join(name.split(".")[:-2])
+        name = canonical_name(name)  # Strip the domain of name.namespace.shortname.cluster.local names
 
-        if name.split(".")[-1] in ALL_SHORTNAMES:  # Name is name.namespace.shortname
+        if parse_name(name).shortname:  # Name is name.namespace.shortname
             return name
         else:
             return f"{name}.{KUBE_SERVICE}"  # Name is name.namespace
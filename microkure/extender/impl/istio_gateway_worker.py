@@ -40,16 +40,13 @@ class IstioGatewayWorker(KubeWorker):
             for virtual_service in cluster.virtual_services:
                 if self._check_gateway_virtualservice_match(gateway, virtual_service):
 
-                    for service in cluster.services:
-                        if service.fullname in virtual_service.destinations \
-                                or service.typed_fullname in virtual_service.destinations:
+                    for service in cluster.find_svc_by_names(virtual_service.destinations):
+                        kube_service_node = model.get_node_by_name(service.fullname, MessageRouter)
 
-                            kube_service_node = model.get_node_by_name(service.fullname, MessageRouter)
-
-                            if kube_service_node is not None and kube_service_node in not_ignored_nodes:
-                                if kube_service_node in model.edge.members:
-                                    model.edge.remove_member(kube_service_node)
-                                model.add_interaction(source_node=gateway_node, target_node=kube_service_node)
+                        if kube_service_node is not None and kube_service_node in not_ignored_nodes:
+                            if kube_service_node in model.edge.members:
+                                model.edge.remove_member(kube_service_node)
+                            model.add_interaction(source_node=gateway_node, target_node=kube_service_node)
 
     def _has_pod_exposed(self, service: KubeService, gateway: KubeIstioGateway, cluster):
         for workload in cluster.find_workload_exposed_by_svc(service):
@@ -7,7 +7,7 @@ from microkure.ignorer.ignorer import IgnoreType
 from microkure.kmodel.kube_container import KubeContainer
 from microkure.kmodel.kube_networking import KubeNetworking
 from microkure.kmodel.kube_workload import KubeWorkload
-from microkure.kmodel.shortnames import ALL_SHORTNAMES
+from microkure.kmodel.names import parse_name
 
 
 class NameWorker(KubeWorker):
@@ -23,8 +23,10 @@ class NameWorker(KubeWorker):
         for node in list(model.nodes):
             if not ignorer.is_ignored(node, IgnoreType.WORKER, self.name):
 
-                if node.name.split(".")[-1] in ALL_SHORTNAMES:
-                    if len([n for n in cluster.cluster_objects + cluster.containers if n.typed_fullname == node.name]) == 0:
+                name_key = parse_name(node.name)
+                # Typed names (name.namespace.shortname) are checked, FQDNs are renamed to their typed name below
+                if name_key.shortname and name_key.typed_fullname == node.name:
+                    if cluster.get_object_by_typed_fullname(name_key.typed_fullname) is None:
                         raise ValueError(self.ERROR_NOT_FOUND.format(name=node.name))
 
                 else:
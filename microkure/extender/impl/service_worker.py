@@ -80,19 +80,17 @@ class ServiceWorker(KubeWorker):
         return message_router_node
 
     def _check_for_missing_interactions(self, model, cluster, mr_node: MessageRouter, k_service: KubeService):
-        for workload in cluster.workloads:
-            if k_service.does_expose_workload(workload):
-
-                for container in workload.containers:
-                    container_exposed = k_service.does_match_ports(container.ports)
-                    service_node = model.get_node_by_name(container.typed_fullname, Service)
-
-                    if service_node and container_exposed:
-                        if service_node not in [n.target for n in mr_node.interactions].copy():
-                            model.add_interaction(mr_node, service_node)
-
-                        for incoming_link in [l for l in service_node.incoming_interactions if isinstance(l.source, Service)]:
-                            model.add_interaction(incoming_link.source, mr_node)
-                            model.delete_relationship(incoming_link)
+        for workload in cluster.find_workload_exposed_by_svc(k_service):
+            for container in workload.containers:
+                container_exposed = k_service.does_match_container(container)
+                service_node = model.get_node_by_name(container.typed_fullname, Service)
+
+                if service_node and container_exposed:
+                    if service_node not in [n.target for n in mr_node.interactions].copy():
+                        model.add_interaction(mr_node, service_node)
+
+                    for incoming_link in [l for l in service_node.incoming_interactions if isinstance(l.source, Service)]:
+                        model.add_interaction(incoming_link.source, mr_node)
+                        model.delete_relationship(incoming_link)
 
 
@@ -0,0 +1,65 @@
+import codecs
+import locale
+
+import yaml
+
+from microkure.utils.utils import YamlLoader
+
+
+def _file_encoding():
+    # The encoding used by open() in text mode, with which YAML files are read
+    return locale.getpreferredencoding(False)
+
+
+class DocumentReference:
+    """Reference to a document of a YAML file, by its byte offsets, to be parsed only when needed."""
+
+    def __init__(self, source_path: str, start: int, end: int):
+        self.source_path = source_path
+        self.start = start
+        self.end = end
+
+    def load(self):
+        # Only the document is read, so that exporting the references of a file does not read it whole for each one
+        with open(self.source_path, "rb") as f:
+            f.seek(self.start)
+            content = f.read(self.end - self.start)
+        return yaml.load(content.decode(_file_encoding()), Loader=YamlLoader)
+
+
+class ByteOffsets:
+    """
+    Converter of the character offsets of a text file (read without newline translation) to byte offsets. Offsets
+    must be converted in increasing order, the file is decoded once, a chunk at a time.
+    """
+
+    CHUNK_SIZE = 2 ** 16
+
+    def __init__(self, filename: str):
+        self._file = open(filename, "rb")
+        self._encoding = _file_encoding()
+        self._decoder = codecs.getincrementaldecoder(self._encoding)()
+        self._buffer = ""  # Decoded text following the current position
+        self._chars = 0
+        self._bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._file.close()
+
+    def to_bytes(self, char_offset: int) -> int:
+        while char_offset - self._chars > len(self._buffer):
+            chunk = self._file.read(self.CHUNK_SIZE)
+            self._advance(len(self._buffer))
+            self._buffer = self._decoder.decode(chunk, final=not chunk)
+            if not chunk:
+                break
+        self._advance(char_offset - self._chars)
+        return self._bytes
+
+    def _advance(self, chars: int):
+        self._bytes += len(self._buffer[:chars].encode(self._encoding))
+        self._chars += chars
+        self._buffer = self._buffer[chars:]
@@ -0,0 +1,66 @@
+import io
+import mmap
+import os
+import re
+
+import yaml
+
+from microkure.utils.utils import YamlLoader, read_data_from_file
+
+# Files smaller than this are not worth splitting, they are parsed by a single process
+MIN_SPLIT_SIZE = 4 * 2 ** 20  # bytes
+
+# A "---" at the start of a line always starts a new document, it cannot appear inside a scalar
+DOCUMENT_START = re.compile(rb"^---(?=[ \t\r\n]|\Z)", re.MULTILINE)
+
+# Directives (%YAML, %TAG) affect the documents following them, so files having them are never split
+DIRECTIVE = re.compile(rb"^%", re.MULTILINE)
+
+
+def split_documents(filename, parts: int) -> list:
+    """
+    Split a multi-document YAML file in at most the given number of byte ranges of similar size, without parsing it.
+    Ranges start at a document start marker (apart from the first one), so each of them is a valid YAML stream.
+    A single range is returned if the file cannot be split safely.
+    """
+    # Empty files cannot be memory-mapped
+    if parts < 2 or os.path.getsize(filename) == 0:
+        return [(0, os.path.getsize(filename))]
+
+    with open(filename, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+
+        if DIRECTIVE.search(mm):
+            return [(0, size)]
+
+        ranges = []
+        start = 0
+        target_size = size // parts
+        for match in DOCUMENT_START.finditer(mm, target_size):
+            if match.start() - start >= target_size:
+                ranges.append((start, match.start()))
+                start = match.start()
+        ranges.append((start, size))
+        return ranges
+
+
+def read_data_from_range(filename, start: int, end: int) -> list:
+    with open(filename, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Decoded as open() does in read_data_from_file, so that the same documents are built
+        stream = io.TextIOWrapper(io.BytesIO(mm[start:end]))
+    return list(yaml.load_all(stream, Loader=YamlLoader))
+
+
+def read_data_from_large_file(filename, executor, parts: int) -> list:
+    """Parse the documents of a big multi-document YAML file in parallel, using the given executor."""
+    ranges = split_documents(filename, parts)
+    if len(ranges) == 1:
+        return read_data_from_file(filename)
+
+    futures = [executor.submit(read_data_from_range, filename, start, end) for start, end in ranges]
+    try:
+        read_data = [document for future in futures for document in future.result()]
+    except yaml.YAMLError:
+        # Parsed again as a whole, for reporting the error as read_data_from_file does
+        return read_data_from_file(filename)
+    return [i for i in read_data if i is not None]
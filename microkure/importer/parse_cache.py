@@ -0,0 +1,72 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+from microkure.utils.utils import read_data_from_file
+
+
+class ParseCache:
+    """
+    On-disk cache of the documents parsed from YAML files. Entries are keyed by file path, size and modification time,
+    so files changed since they have been cached are parsed again.
+    """
+
+    DEFAULT_MAX_SIZE = 512 * 2 ** 20  # bytes
+    ENTRY_EXTENSION = ".pickle"
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_SIZE):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def read_data_from_file(self, filename, parse=read_data_from_file) -> list:
+        entry = self._entry_path(filename)
+
+        try:
+            with open(entry, "rb") as f:
+                data = pickle.load(f)
+            os.utime(entry)  # Mark the entry as recently used
+            return data
+        except FileNotFoundError:
+            pass
+        except (pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            os.remove(entry)  # Corrupted entry
+
+        data = parse(filename)
+        self._write_entry(entry, data)
+        return data
+
+    def evict(self):
+        """Remove the least recently used entries until the cache fits its maximum size."""
+        entries = []
+        for file in os.scandir(self.cache_dir):
+            if file.name.endswith(self.ENTRY_EXTENSION):
+                stat = file.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, file.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def _entry_path(self, filename) -> str:
+        stat = os.stat(filename)
+        key = f"{os.path.abspath(filename)}:{stat.st_size}:{stat.st_mtime_ns}"
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + self.ENTRY_EXTENSION)
+
+    def _write_entry(self, entry, data):
+        # Written to a temporary file first, so that concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
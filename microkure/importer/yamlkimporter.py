@@ -1,39 +1,173 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 from microfreshener.core.logging import MyLogger
 
 from microkure.kmodel.kube_object_factory import KubeObjectFactory
+from .document_reference import DocumentReference, ByteOffsets
+from .document_splitter import MIN_SPLIT_SIZE, read_data_from_large_file
 from .kimporter import KImporter
+from .parse_cache import ParseCache
 from ..exporter.export_object import ExportObject
 from ..kmodel.kube_cluster import KubeCluster
-from ..utils.utils import get_filenames_from_directory, is_yaml, read_data_from_file
+from ..kmodel.kube_object import KubeObject
+from ..utils.archive import ArchiveReader, is_archive
+from ..utils.utils import get_filenames_from_directory, is_filename_selected, is_yaml, is_json, \
+    read_data_from_file, read_data_from_json_file, read_data_from_stream, read_data_from_json_stream, \
+    iter_document_nodes, get_node_kind
 
 
 class YamlKImporter(KImporter):
 
-    def __init__(self):
+    def __init__(self, workers: int = 1, cache: ParseCache = None, unsupported_as_reference: bool = False,
+                 include: list = None, exclude: list = None):
         super().__init__()
         self.cluster = KubeCluster()
+        self.workers = workers  # Number of processes used for parsing files, files are parsed serially if 1
+        self.cache = cache  # If set, parsed documents are read from and stored in this cache
+
+        # If set, documents of kinds not supported by KubeObjectFactory are not parsed, but only referenced. Files are
+        # then read one at a time by this process, without the workers and the cache
+        self.unsupported_as_reference = unsupported_as_reference
+
+        # Glob patterns selecting the files to import, other than the ones in always ignored folders (e.g. .git)
+        self.include = include
+        self.exclude = exclude
 
     def Import(self, path: str) -> KubeCluster:
-        filename_list = get_filenames_from_directory(path=path)
+        if is_archive(path):
+            return self._import_archive(path)
+
+        if self.unsupported_as_reference:
+            for imported, file, document_index in self._iter_objects(path):
+                self._add_to_cluster(imported, file, f"{path}/{file}", document_index)
+            return self.cluster
+
+        filename_list = get_filenames_from_directory(path, self.include, self.exclude)
         MyLogger().get_logger().debug(f"Found {len(filename_list)} files in folder {path}: {filename_list}")
 
+        manifest_filenames = [file for file in filename_list if is_yaml(file) or is_json(file)]
+        manifest_data = dict(zip(manifest_filenames,
+                                 self._read_files([f"{path}/{file}" for file in manifest_filenames])))
+
         for file in filename_list:
             file_fullpath = f"{path}/{file}"
 
-            if is_yaml(file):
+            if file in manifest_data:
 
                 # Build objects
-                data = read_data_from_file(file_fullpath)
-                for deploy_data in data:
-                    kObject = KubeObjectFactory.build_object(object_dict=deploy_data, filename=file)
-
-                    if kObject is not None:
-                        self.cluster.add_object(kObject)
-                        self.cluster.add_export_object(ExportObject(kObject, file))
-                    else:
-                        self.cluster.add_export_object(ExportObject(deploy_data, file))
+                build_function = self._build_json_objects if is_json(file) else self._build_objects
+                for imported, _, document_index in build_function(manifest_data[file], file):
+                    self._add_to_cluster(imported, file, file_fullpath, document_index)
+            else:
+                self._add_to_cluster(None, file, file_fullpath)
+
+        return self.cluster
+
+    def iter_objects(self, path: str):
+        """
+        Lazily yield a (object, filename) pair for each document found in the files of the folder. The object is the
+        KubeObject built from the document, the parsed document if its kind is not supported (or a DocumentReference
+        to it, if unsupported_as_reference is set) or None for files that are neither YAML nor JSON files.
+        """
+        for imported, file, _ in self._iter_objects(path):
+            yield imported, file
+
+    def _iter_objects(self, path: str):
+        # Objects are yielded along with the position of their document in the file
+        for file in get_filenames_from_directory(path, self.include, self.exclude):
+            file_fullpath = f"{path}/{file}"
+
+            if is_yaml(file):
+                with ByteOffsets(file_fullpath) as offsets:
+                    for document_index, (loader, node) in enumerate(iter_document_nodes(file_fullpath)):
+                        kind = get_node_kind(node)
+                        if self.unsupported_as_reference and not KubeObjectFactory.is_supported(kind) \
+                                and not KubeObjectFactory.is_list(kind):
+                            reference = DocumentReference(file_fullpath, offsets.to_bytes(node.start_mark.index),
+                                                          offsets.to_bytes(node.end_mark.index))
+                            yield reference, file, document_index
+                        else:
+                            yield from self._build_objects([loader.construct_document(node)], file, document_index)
+            elif is_json(file):
+                yield from self._build_json_objects(read_data_from_json_file(file_fullpath), file)
             else:
-                self.cluster.add_export_object(ExportObject(None, file))
+                yield None, file, None
+
+    def _import_archive(self, path: str) -> KubeCluster:
+        # Members are parsed while the archive is read, without extracting them to disk
+        with ArchiveReader(path) as archive:
+            for file, _, stream in archive.members():
+                if not is_filename_selected(file, self.include, self.exclude):
+                    continue
+
+                file_fullpath = f"{path}/{file}"
+
+                if is_yaml(file):
+                    objects = self._build_objects(read_data_from_stream(io.TextIOWrapper(stream), file_fullpath), file)
+                elif is_json(file):
+                    objects = self._build_json_objects(read_data_from_json_stream(stream, file_fullpath), file)
+                else:
+                    self._add_to_cluster(None, file, file_fullpath)
+                    continue
+
+                for imported, _, document_index in objects:
+                    self._add_to_cluster(imported, file, file_fullpath, document_index)
 
         return self.cluster
 
+    @staticmethod
+    def _build_objects(data: list, file: str, first_index: int = 0):
+        for document_index, document in enumerate(data, first_index):
+            for deploy_data in KubeObjectFactory.flatten([document]):
+                kObject = KubeObjectFactory.build_object(object_dict=deploy_data, filename=file)
+                yield kObject if kObject is not None else deploy_data, file, document_index
+
+    @staticmethod
+    def _build_json_objects(data: list, file: str) -> list:
+        objects = list(YamlKImporter._build_objects(data, file))
+
+        # JSON files without Kubernetes objects (e.g. package.json) or that cannot be parsed are copied as they are
+        if not any(isinstance(imported, KubeObject) for imported, _, _ in objects):
+            return [(None, file, None)]
+        return objects
+
+    def _add_to_cluster(self, imported, file, file_fullpath, document_index=None):
+        if isinstance(imported, KubeObject):
+            self.cluster.add_object(imported)
+        self.cluster.add_export_object(ExportObject(imported, file, file_fullpath, document_index))
+
+    def _read_files(self, file_fullpaths: list) -> list:
+        read_function = partial(read_manifest_file, cache=self.cache)
+
+        if self.workers > 1:
+            # Big YAML files are split in chunks of documents parsed in parallel, the others are parsed one per process
+            large_files = {file for file in file_fullpaths if is_yaml(file) and os.path.getsize(file) >= MIN_SPLIT_SIZE}
+            small_files = [file for file in file_fullpaths if file not in large_files]
+            chunksize = max(1, len(small_files) // (self.workers * 4))
+
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                # map() returns results in submission order, so objects keep the same order as a serial import
+                data = dict(zip(small_files, executor.map(read_function, small_files, chunksize=chunksize)))
+
+                parse_large_file = partial(read_data_from_large_file, executor=executor, parts=self.workers)
+                for file in large_files:
+                    data[file] = self.cache.read_data_from_file(file, parse_large_file) if self.cache \
+                        else parse_large_file(file)
+
+            result = [data[file] for file in file_fullpaths]
+        else:
+            result = [read_function(file) for file in file_fullpaths]
+
+        if self.cache:
+            self.cache.evict()
+        return result
+
+
+def read_manifest_file(filename, cache: ParseCache = None) -> list:
+    # Parsing JSON is about as fast as reading a cache entry, so only YAML files are cached
+    if is_json(filename):
+        return read_data_from_json_file(filename)
+    return cache.read_data_from_file(filename) if cache else read_data_from_file(filename)
@@ -1,5 +1,4 @@
-
-from typing import List
+from typing import List, Tuple
 
 from microkure.exporter.export_object import ExportObject
 from microkure.kmodel.kube_container import KubeContainer
@@ -7,105 +6,253 @@ from microkure.kmodel.kube_istio import KubeVirtualService, KubeDestinationRule,
 from microkure.kmodel.kube_networking import KubeService, KubeIngress, KubeNetworking
 from microkure.kmodel.kube_object import KubeObject
 from microkure.kmodel.kube_workload import KubeWorkload
-from microkure.kmodel.utils import name_is_FQDN
+from microkure.kmodel.names import canonical_name
+from microkure.kmodel.utils import label_pairs
 
 
 class KubeCluster:
 
+    # Kinds for which the cluster keeps a dedicated collection, so that accessors do not scan every object
+    INDEXED_KINDS = [KubeWorkload, KubeNetworking, KubeService, KubeIngress, KubeVirtualService,
+                     KubeDestinationRule, KubeIstioGateway]
+
     def __init__(self):
-        self.cluster_objects: list[KubeObject] = list()
-        self.cluster_export_info: list[ExportObject] = list()
+        # Dicts are used as insertion-ordered sets, so that membership and removal are O(1)
+        self._objects: dict[KubeObject, None] = dict()
+        self._objects_by_kind: dict[type, dict[KubeObject, None]] = {kind: dict() for kind in self.INDEXED_KINDS}
+
+        # Name indexes, covering both cluster objects and the containers defined by workloads
+        self._objects_by_name: dict[str, dict[KubeObject, None]] = dict()
+        self._objects_by_fullname: dict[str, dict[KubeObject, None]] = dict()
+        self._objects_by_typed_fullname: dict[str, dict[KubeObject, None]] = dict()
+        self._indexed_names: dict[KubeObject, list] = dict()  # Object -> [(indexed object, name, fullname, typed_fullname)]
+
+        # Inverted indexes from a (key, value) label pair to the workloads having it and the services selecting it
+        self._workloads_by_label: dict[str, dict[KubeWorkload, None]] = dict()
+        self._services_by_selector: dict[str, dict[KubeService, None]] = dict()
+        self._indexed_labels: dict[KubeObject, set] = dict()
+
+        self._insertion_number: dict[KubeObject, int] = dict()
+        self._insertion_counter = 0
+
+        # Export info, indexed by the exported kube object and by output file
+        self._export_info: dict[ExportObject, None] = dict()
+        self._export_info_by_object: dict[KubeObject, dict[ExportObject, None]] = dict()
+        self._export_info_by_file: dict[str, dict[ExportObject, None]] = dict()
+        self._files_with_removed_objects: set[str] = set()
+        self._removed_export_info: dict[ExportObject, None] = dict()  # Removed export info of imported objects
+
+    # Read-only snapshots: objects and export info are added and removed only through the methods of the cluster,
+    # which keep the indexes up to date, so tuples are returned to make any attempt to mutate them fail
 
     @property
-    def workloads(self):
-        return [obj for obj in self.cluster_objects if isinstance(obj, KubeWorkload)]
+    def cluster_objects(self) -> Tuple[KubeObject, ...]:
+        return tuple(self._objects)
 
     @property
-    def networkings(self):
-        return [n for n in self.cluster_objects if isinstance(n, KubeNetworking)]
+    def cluster_export_info(self) -> Tuple[ExportObject, ...]:
+        return tuple(self._export_info)
 
     @property
-    def services(self):
-        return [svc for svc in self.cluster_objects if isinstance(svc, KubeService)]
+    def removed_export_info(self) -> Tuple[ExportObject, ...]:
+        return tuple(self._removed_export_info)
 
     @property
-    def containers(self):
-        return [container for sublist in [w.containers for w in self.workloads] for container in sublist]
+    def workloads(self) -> List[KubeWorkload]:
+        return self._get_objects_of_kind(KubeWorkload)
 
     @property
-    def ingress(self):
-        return [ing for ing in self.cluster_objects if isinstance(ing, KubeIngress)]
+    def networkings(self) -> List[KubeNetworking]:
+        return self._get_objects_of_kind(KubeNetworking)
 
     @property
-    def virtual_services(self):
-        return [vs for vs in self.cluster_objects if isinstance(vs, KubeVirtualService)]
+    def services(self) -> List[KubeService]:
+        return self._get_objects_of_kind(KubeService)
 
     @property
-    def destination_rules(self):
-        return [dr for dr in self.cluster_objects if isinstance(dr, KubeDestinationRule)]
+    def containers(self) -> List[KubeContainer]:
+        return [container for w in self._objects_by_kind[KubeWorkload] for container in w.containers]
 
     @property
-    def istio_gateways(self):
-        return [ig for ig in self.cluster_objects if isinstance(ig, KubeIstioGateway)]
+    def ingress(self) -> List[KubeIngress]:
+        return self._get_objects_of_kind(KubeIngress)
+
+    @property
+    def virtual_services(self) -> List[KubeVirtualService]:
+        return self._get_objects_of_kind(KubeVirtualService)
+
+    @property
+    def destination_rules(self) -> List[KubeDestinationRule]:
+        return self._get_objects_of_kind(KubeDestinationRule)
+
+    @property
+    def istio_gateways(self) -> List[KubeIstioGateway]:
+        return self._get_objects_of_kind(KubeIstioGateway)
+
+    def _get_objects_of_kind(self, kind: type) -> list:
+        return list(self._objects_by_kind[kind])
 
     def add_object(self, kube_object):
-        if not kube_object in self.cluster_objects:
-            self.cluster_objects.append(kube_object)
+        if kube_object not in self._objects:
+            self._objects[kube_object] = None
+
+            for kind, objects in self._objects_by_kind.items():
+                if isinstance(kube_object, kind):
+                    objects[kube_object] = None
+
+            self._index_names(kube_object)
+            self._index_labels(kube_object)
+            self._insertion_number[kube_object] = self._insertion_counter
+            self._insertion_counter += 1
+            kube_object._cluster = self
 
     def remove_object(self, kube_object):
-        if kube_object in self.cluster_objects:
-            self.cluster_objects.remove(kube_object)
+        if kube_object in self._objects:
+            del self._objects[kube_object]
+
+            for objects in self._objects_by_kind.values():
+                objects.pop(kube_object, None)
+
+            self._unindex_names(kube_object)
+            self._unindex_labels(kube_object)
+            del self._insertion_number[kube_object]
+            kube_object._cluster = None
+
+        for exp in list(self._export_info_by_object.get(kube_object, {})):
+            self.remove_export_object(exp)
 
-        for exp in self.cluster_export_info:
-            if exp.kube_object == kube_object:
-                self.cluster_export_info.remove(exp)
+    def update_object(self, kube_object):
+        """Refresh the indexes of an object already in the cluster, after its name, labels or containers changed."""
+        if kube_object in self._objects:
+            self._unindex_names(kube_object)
+            self._index_names(kube_object)
+            self._unindex_labels(kube_object)
+            self._index_labels(kube_object)
+
+    def _index_names(self, kube_object):
+        indexed = [kube_object]
+        if isinstance(kube_object, KubeWorkload):
+            indexed += kube_object.containers
+
+        entries = [(obj, obj.name, obj.fullname, obj.typed_fullname) for obj in indexed]
+        for obj, name, fullname, typed_fullname in entries:
+            self._objects_by_name.setdefault(name, {})[obj] = None
+            self._objects_by_fullname.setdefault(fullname, {})[obj] = None
+            self._objects_by_typed_fullname.setdefault(typed_fullname, {})[obj] = None
+
+        self._indexed_names[kube_object] = entries
+
+    def _unindex_names(self, kube_object):
+        for obj, name, fullname, typed_fullname in self._indexed_names.pop(kube_object, []):
+            for index, key in [(self._objects_by_name, name), (self._objects_by_fullname, fullname),
+                               (self._objects_by_typed_fullname, typed_fullname)]:
+                objects = index.get(key, {})
+                objects.pop(obj, None)
+                if not objects:
+                    index.pop(key, None)
+
+    def _get_label_index(self, kube_object):
+        if isinstance(kube_object, KubeWorkload):
+            return self._workloads_by_label, kube_object.labels
+        if isinstance(kube_object, KubeService):
+            return self._services_by_selector, kube_object.selectors
+        return None, None
+
+    def _index_labels(self, kube_object):
+        index, labels = self._get_label_index(kube_object)
+        if index is not None:
+            pairs = label_pairs(labels)
+            for pair in pairs:
+                index.setdefault(pair, {})[kube_object] = None
+            self._indexed_labels[kube_object] = pairs
+
+    def _unindex_labels(self, kube_object):
+        index, _ = self._get_label_index(kube_object)
+        for pair in self._indexed_labels.pop(kube_object, set()):
+            objects = index.get(pair, {})
+            objects.pop(kube_object, None)
+            if not objects:
+                index.pop(pair, None)
+
+    def _find_by_label_pairs(self, index, labels: dict) -> list:
+        candidates = {obj for pair in label_pairs(labels) for obj in index.get(pair, {})}
+        return sorted(candidates, key=self._insertion_number.get)
 
     def add_export_object(self, export_object: ExportObject):
-        self.cluster_export_info.append(export_object)
+        self._export_info[export_object] = None
+        self._removed_export_info.pop(export_object, None)
+        if isinstance(export_object.kube_object, KubeObject):
+            self._export_info_by_object.setdefault(export_object.kube_object, {})[export_object] = None
+        self._export_info_by_file.setdefault(export_object.out_fullname, {})[export_object] = None
 
-    def find_workload_exposed_by_svc(self, service: KubeService) -> List[KubeWorkload]:
-        return [w for w in self.workloads if service.does_expose_workload(w)]
+    def remove_export_object(self, export_object: ExportObject):
+        if export_object in self._export_info:
+            del self._export_info[export_object]
 
-    def find_svc_exposing_workload(self, workload: KubeWorkload):
-        return [s for s in self.services if s.does_expose_workload(workload)]
+            if export_object.filename:
+                self._files_with_removed_objects.add(export_object.out_fullname)
+                self._removed_export_info[export_object] = None
 
-    def get_object_by_name(self, object_name: str, type: type = KubeObject):
-        if name_is_FQDN(object_name):
-            object_name = '.'.join(object_name.split('.')[:-2])
+            for index, key in [(self._export_info_by_object, export_object.kube_object),
+                               (self._export_info_by_file, export_object.out_fullname)]:
+                if isinstance(key, (KubeObject, str)):
+                    exp_objects = index.get(key, {})
+                    exp_objects.pop(export_object, None)
+                    if not exp_objects:
+                        index.pop(key, None)
 
-        objects_found = []
-        for obj in self.cluster_objects + self.containers:
+    def find_workload_selected_by_svc(self, service: KubeService) -> List[KubeWorkload]:
+        return self._find_by_label_pairs(self._workloads_by_label, service.selectors)
 
-            # Case: name is <name>.<namespace>.<shortname>
-            if obj.typed_fullname == object_name:
-                if not obj in objects_found:
-                    objects_found.append(obj)
+    def find_svc_selecting_workload(self, workload: KubeWorkload) -> List[KubeService]:
+        return self._find_by_label_pairs(self._services_by_selector, workload.labels)
 
-            # Case: name is <name>.<namespace>
-            if obj.fullname == object_name:
-                if not obj in objects_found:
-                    objects_found.append(obj)
+    def find_workload_exposed_by_svc(self, service: KubeService) -> List[KubeWorkload]:
+        return [w for w in self.find_workload_selected_by_svc(service) if service.does_expose_workload(w)]
 
-            # Case: name in only <name>
-            if obj.name == object_name:
-                if not obj in objects_found:
-                    objects_found.append(obj)
+    def find_svc_exposing_workload(self, workload: KubeWorkload):
+        return [s for s in self.find_svc_selecting_workload(workload) if s.does_expose_workload(workload)]
 
-        objects_found = [o for o in objects_found if isinstance(o, type)]
+    def find_svc_by_names(self, names: list) -> List[KubeService]:
+        """Return the services whose fullname or typed_fullname is one of the given names."""
+        services = {obj for name in names for index in [self._objects_by_fullname, self._objects_by_typed_fullname]
+                    for obj in index.get(name, {}) if isinstance(obj, KubeService)}
+        return sorted(services, key=self._insertion_number.get)
+
+    def get_object_by_name(self, object_name: str, type: type = KubeObject):
+        object_name = canonical_name(object_name)
+
+        # Cases: name is <name>.<namespace>.<shortname>, <name>.<namespace> or only <name>
+        objects_found = dict()
+        for index in [self._objects_by_typed_fullname, self._objects_by_fullname, self._objects_by_name]:
+            for obj in index.get(object_name, {}):
+                if isinstance(obj, type):
+                    objects_found[obj] = None
 
         #TODO questo controllo non mi convince
         if len(objects_found) == 0 and type == KubeContainer:
-            for wl in self.workloads:
-                if wl.fullname == object_name or wl.typed_fullname == object_name:
-                    if len(wl.containers) == 1:
+            for index in [self._objects_by_fullname, self._objects_by_typed_fullname]:
+                for wl in index.get(object_name, {}):
+                    if isinstance(wl, KubeWorkload) and len(wl.containers) == 1:
                         return wl.containers[0]
 
         if len(objects_found) > 1:
             raise AttributeError(f"More than one object found with name '{object_name}'")
 
-        return objects_found[0] if objects_found else None
+        return next(iter(objects_found)) if objects_found else None
+
+    def get_object_by_typed_fullname(self, typed_fullname: str):
+        objects = self._objects_by_typed_fullname.get(typed_fullname, {})
+        return next(iter(objects)) if objects else None
 
     def get_exp_object(self, kube_object):
-        for obj in self.cluster_export_info:
-            if obj.kube_object == kube_object:
-                return obj
\ No newline at end of file
+        exp_objects = self._export_info_by_object.get(kube_object, {}) if isinstance(kube_object, KubeObject) else {}
+        return next(iter(exp_objects)) if exp_objects else None
+
+    def get_exp_objects_by_file(self, out_fullname: str) -> List[ExportObject]:
+        return list(self._export_info_by_file.get(out_fullname, {}))
+
+    def is_file_modified(self, out_fullname: str) -> bool:
+        """Return true if the content of the output file differs from its source, due to modified or removed objects."""
+        return out_fullname in self._files_with_removed_objects or \
+            any(exp.is_modified for exp in self._export_info_by_file.get(out_fullname, {}))
@@ -1,32 +1,41 @@
 from microkure.kmodel.kube_object import KubeObject
+from microkure.kmodel.ports import container_port_keys
 
 
 class KubeContainer(KubeObject):
 
+    __slots__ = ("defining_workload",)
+
     def __init__(self, data: dict, workload):
         super().__init__(data)
         self.defining_workload = workload
 
-    @property
-    def name(self):
-        return self.data.get("name", "")
+    def _get_identity(self):
+        if self._identity is None:
+            name = self._data.get("name", "")
+            namespace = self._data.get("metadata", {}).get("namespace", self.DEFAULT_NAMESPACE)
+            self._identity = (name, namespace, f"{name}.{self.defining_workload.fullname}",
+                              f"{name}.{self.defining_workload.typed_fullname}")
+        return self._identity
 
     @property
     def ports(self):
         return self.data.get("ports", {})
 
     @property
-    def fullname(self):
-        return f"{self.name}.{self.defining_workload.fullname}"
-
-    @property
-    def typed_fullname(self):
-        return f"{self.name}.{self.defining_workload.typed_fullname}"
+    def port_keys(self) -> frozenset:
+        return self._get_view("port_keys", lambda: container_port_keys(self.ports))
 
     @property
     def image(self):
         return self.data.get("image", "")
 
+    def remove_host_ports(self):
+        for port in self.ports:
+            if port.get("hostPort"):
+                del port["hostPort"]
+        self.defining_workload.mark_modified()
+
     def get_container_ports(self):
         result = []
         for p in self.ports:
@@ -2,22 +2,35 @@ import re
 from typing import List, Dict
 
 from microkure.kmodel.kube_object import KubeObject
-from microkure.kmodel.utils import name_has_namespace
+from microkure.kmodel.names import qualify_name
 from microkure.kmodel.shortnames import ISTIO_VIRTUAL_SERVICE, ISTIO_DESTINATION_RULE, ISTIO_GATEWAY
 
 
 class KubeIstio(KubeObject):
-    pass
+    __slots__ = ()
 
 
 class KubeVirtualService(KubeIstio):
 
+    __slots__ = ()
+
     def __init__(self, data: dict):
         super().__init__(data)
         self.shortname = ISTIO_VIRTUAL_SERVICE
 
     @property
     def timeouts(self):
+        return self._get_view("timeouts", self._build_timeouts)
+
+    @property
+    def destinations(self):
+        return self._get_view("destinations", self._build_destinations)
+
+    @property
+    def gateways(self):
+        return self._get_view("gateways", self._build_gateways)
+
+    def _build_timeouts(self):
         result: List[(str, str, str)] = []
 
         for host in self.data.get('spec', {}).get('hosts', []):
@@ -27,26 +40,24 @@ class KubeVirtualService(KubeIstio):
                     if timeout is not None:
                         destination = route.get('destination', {}).get('host', None)
                         if destination is not None:
-                            host = host if name_has_namespace(host) else f"{host}.{self.namespace}"
-                            destination = destination if name_has_namespace(destination) else f"{destination}.{self.namespace}"
+                            host = qualify_name(host, self.namespace)
+                            destination = qualify_name(destination, self.namespace)
                             result.append((host, destination, timeout))
         return result
 
-    @property
-    def destinations(self):
+    def _build_destinations(self):
         result: List[str] = []
         for http_route in self.data.get('spec', {}).get('http', []):
             for destination_route in http_route.get('route', []):
                 destination = destination_route.get('destination', {}).get('host', None)
                 if destination is not None:
-                    result.append(destination if name_has_namespace(destination) else f"{destination}.{self.namespace}")
+                    result.append(qualify_name(destination, self.namespace))
         return result
 
-    @property
-    def gateways(self):
+    def _build_gateways(self):
         res = []
         for g in self.data.get("spec", {}).get("gateways", []):
-            res.append(g if name_has_namespace(g) else f"{g}.{self.namespace}")
+            res.append(qualify_name(g, self.namespace))
         return res
 
     @property
@@ -60,6 +71,8 @@ class KubeVirtualService(KubeIstio):
 
 class KubeDestinationRule(KubeIstio):
 
+    __slots__ = ()
+
     def __init__(self, data: dict):
         super().__init__(data)
         self.shortname = ISTIO_DESTINATION_RULE
@@ -72,7 +85,7 @@ class KubeDestinationRule(KubeIstio):
     @property
     def host(self):
         host = self.data.get("spec", {}).get("host", None)
-        return host if name_has_namespace(host) else f"{host}.{self.namespace}"
+        return qualify_name(host, self.namespace)
 
     @property
     def timeout(self) -> str:
@@ -81,12 +94,17 @@ class KubeDestinationRule(KubeIstio):
 
 
 class KubeIstioGateway(KubeIstio):
+    __slots__ = ()
+
     def __init__(self, data: dict):
         super().__init__(data)
         self.shortname = ISTIO_GATEWAY
 
     @property
     def hosts_exposed(self):
+        return self._get_view("hosts_exposed", self._build_hosts_exposed)
+
+    def _build_hosts_exposed(self):
         result = []
         servers = self.data.get("spec", {}).get("servers", [])
         for server in servers:
@@ -1,15 +1,20 @@
 from microkure.kmodel.kube_object import KubeObject
-from microkure.kmodel.utils import does_selectors_labels_match, name_has_namespace
+from microkure.kmodel.names import qualify_name
+from microkure.kmodel.utils import does_selectors_labels_match
 from microkure.kmodel.kube_workload import KubeWorkload
+from microkure.kmodel.kube_container import KubeContainer
+from microkure.kmodel.ports import container_port_keys, service_port_keys
 from microkure.kmodel.shortnames import KUBE_INGRESS, KUBE_SERVICE
 
 
 class KubeNetworking(KubeObject):
-    pass
+    __slots__ = ()
 
 
 class KubeService(KubeNetworking):
 
+    __slots__ = ()
+
     def __init__(self, data: dict):
         super().__init__(data)
         self.shortname = KUBE_SERVICE
@@ -18,10 +23,22 @@ class KubeService(KubeNetworking):
     def selectors(self):
         return self.data.get("spec", {}).get("selector", {})
 
+    def set_selectors(self, selectors: dict):
+        self.data.setdefault("spec", {})["selector"] = selectors
+        self.mark_modified()
+
     @property
     def ports(self):
         return self.data.get("spec", {}).get("ports", [])
 
+    @property
+    def port_keys(self) -> frozenset:
+        return self._get_view("port_keys", lambda: service_port_keys(self.ports))
+
+    def add_port(self, port: dict):
+        self.data["spec"].setdefault("ports", []).append(port)
+        self.mark_modified()
+
     @property
     def type(self):
         return self.data.get("spec", {}).get("type", "ClusterIP")
@@ -34,7 +51,7 @@ class KubeService(KubeNetworking):
 
     def does_expose_workload(self, workload: KubeWorkload):
         return does_selectors_labels_match(self.selectors, workload.labels) and \
-               self.does_match_ports([item for sublist in [c.ports for c in workload.containers] for item in sublist])
+               any(self.does_match_container(c) for c in workload.containers)
 
     def can_expose_workload(self, workload: KubeWorkload, only_ports: list = None):
         label_match = does_selectors_labels_match(self.selectors, workload.labels)
@@ -42,24 +59,17 @@ class KubeService(KubeNetworking):
 
         return label_match and not self.does_match_ports(ports_to_consider)
 
-    def does_match_ports(self, ports_to_check):
-        for svc_port in self.ports:
-            for w_port in ports_to_check:
-                # If targetPort is not defined, port is considered
-                port_to_consider = svc_port.get("targetPort", svc_port.get("port", None))
-                target_port_match = \
-                    port_to_consider == w_port.get("name", "") or \
-                    port_to_consider == w_port.get("containerPort", "")
-
-                protocol_match = svc_port.get("protocol", "TCP") == w_port.get("protocol", "TCP")
+    def does_match_container(self, container: KubeContainer):
+        return not self.port_keys.isdisjoint(container.port_keys)
 
-                if target_port_match and protocol_match:
-                    return True
-        return False
+    def does_match_ports(self, ports_to_check):
+        return not self.port_keys.isdisjoint(container_port_keys(ports_to_check))
 
 
 class KubeIngress(KubeNetworking):
 
+    __slots__ = ()
+
     def __init__(self, data: dict):
         super().__init__(data)
         self.shortname = KUBE_INGRESS
@@ -75,4 +85,4 @@ class KubeIngress(KubeNetworking):
                 if svc_name:
                     result.append(svc_name)
 
-        return [s if name_has_namespace(s) else f"{s}.{self.namespace}" for s in result]
+        return [qualify_name(s, self.namespace) for s in result]
@@ -1,29 +1,101 @@
+import copy
+
 
 class KubeObject:
     DEFAULT_NAMESPACE = "default"
 
+    __slots__ = ("_data", "shortname", "export_filename", "dirty", "_cluster", "_identity", "_views")
+
     def __init__(self, data: dict):
-        self.data: dict = data
+        self._data: dict = data
         self.shortname = ""
+        self.export_filename = None
+        self.dirty = False  # True once data has been modified through mark_modified
+        self._cluster = None  # The KubeCluster this object has been added to, notified on identity changes
+        self._identity = None  # Cached (name, namespace, fullname, typed_fullname)
+        self._views = None  # Cached values derived from data, by view name
+
+    @classmethod
+    def _all_slots(cls):
+        return [slot for klass in cls.__mro__ for slot in getattr(klass, "__slots__", ())]
+
+    def __deepcopy__(self, memo):
+        # The copy does not belong to any cluster until it is explicitly added to one
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+        for slot in self._all_slots():
+            if hasattr(self, slot):
+                setattr(result, slot, None if slot == "_cluster" else copy.deepcopy(getattr(self, slot), memo))
+        return result
+
+    @property
+    def data(self) -> dict:
+        """
+        The manifest of the object. Names, labels and other values derived from it are cached, also by the cluster
+        indexes, so it must be changed through the mutators (set_name, set_labels, ...), or mark_modified() must be
+        called after changing it directly.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, data: dict):
+        self._data = data
+        self.mark_modified()
+
+    def mark_modified(self):
+        """Notify that data has been modified, so that every value derived from it is computed again."""
+        self.dirty = True
+        self._identity = None
+        self._views = None
+        self._notify_cluster()
+
+    def _get_view(self, view_name: str, build_view):
+        if self._views is None:
+            self._views = {}
+        if view_name not in self._views:
+            self._views[view_name] = build_view()
+        return self._views[view_name]
+
+    def _get_identity(self):
+        if self._identity is None:
+            metadata = self._data.get("metadata", {})
+            name = metadata.get("name", "")
+            namespace = metadata.get("namespace", self.DEFAULT_NAMESPACE)
+            fullname = f"{name}.{namespace}"
+            self._identity = (name, namespace, fullname, f"{fullname}.{self.shortname}")
+        return self._identity
 
     @property
     def name(self):
-        return self.data.get("metadata", {}).get("name", "")
+        return self._get_identity()[0]
 
     @property
     def namespace(self):
-        return self.data.get("metadata", {}).get("namespace", self.DEFAULT_NAMESPACE)
+        return self._get_identity()[1]
 
     @property
     def fullname(self):
-        return f"{self.name}.{self.namespace}"
+        return self._get_identity()[2]
 
     @property
     def typed_fullname(self):
-        return f"{self.fullname}.{self.shortname}"
+        return self._get_identity()[3]
+
+    def set_name(self, name: str):
+        self._data.setdefault("metadata", {})["name"] = name
+        self.mark_modified()
+
+    def set_namespace(self, namespace: str):
+        self._data.setdefault("metadata", {})["namespace"] = namespace
+        self.mark_modified()
 
     def set_labels(self, labels: dict):
         if self.data.get("metadata", {}).get("labels", None):
             self.data["metadata"]["labels"].update(labels)
         else:
             self.data["metadata"]["labels"] = labels
+        self.mark_modified()
+
+    def _notify_cluster(self):
+        if self._cluster is not None:
+            self._cluster.update_object(self)
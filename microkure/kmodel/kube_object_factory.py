@@ -16,6 +16,26 @@ class KubeObjectFactory:
         "Gateway": KubeIstioGateway
     }
 
+    @staticmethod
+    def is_supported(object_kind) -> bool:
+        return object_kind in KubeObjectFactory.kind_class_mapping
+
+    @staticmethod
+    def is_list(object_kind) -> bool:
+        return isinstance(object_kind, str) and object_kind.endswith("List")
+
+    @staticmethod
+    def flatten(object_dicts) -> list:
+        """Replace List objects (e.g. List, PodList) with the objects they contain."""
+        flat_dicts = []
+        for object_dict in object_dicts:
+            if isinstance(object_dict, dict) and KubeObjectFactory.is_list(object_dict.get("kind")) \
+                    and isinstance(object_dict.get("items"), list):
+                flat_dicts += KubeObjectFactory.flatten(object_dict["items"])
+            else:
+                flat_dicts.append(object_dict)
+        return flat_dicts
+
     @staticmethod
     def build_object(object_dict, filename):
         object_kind = object_dict.get("kind", None)
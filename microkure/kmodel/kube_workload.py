@@ -9,8 +9,17 @@ from microkure.kmodel.utils import cast_container_list, container_to_dict
 
 class KubeWorkload(KubeObject):
 
+    __slots__ = ("_containers",)
+
     def __init__(self, data: dict):
         super().__init__(data)
+        self._containers = None  # Container wrappers, built on first access and rebuilt only by set_containers
+
+    def mark_modified(self):
+        # Container names and views are built on top of the workload data
+        for container in self._containers or []:
+            container.mark_modified()
+        super().mark_modified()
 
     @property
     @abstractmethod
@@ -47,16 +56,22 @@ class KubeWorkload(KubeObject):
 
 class KubePod(KubeWorkload):
 
+    __slots__ = ()
+
     def __init__(self, data: dict):
         super().__init__(data)
         self.shortname = KUBE_POD
 
     @property
     def containers(self):
-        return cast_container_list(self.data.get("spec", {}).get("containers", []), self)
+        if self._containers is None:
+            self._containers = cast_container_list(self.data.get("spec", {}).get("containers", []), self)
+        return self._containers
 
     def set_containers(self, container_list):
         self.data["spec"]["containers"] = container_to_dict(container_list)
+        self._containers = None
+        self.mark_modified()
 
     @property
     def labels(self):
@@ -72,6 +87,7 @@ class KubePod(KubeWorkload):
 
     def set_host_network(self, host_network: bool):
         self.data["spec"]["hostNetwork"] = host_network
+        self.mark_modified()
 
     @property
     def pod_spec(self):
@@ -80,6 +96,8 @@ class KubePod(KubeWorkload):
 
 class KubePodDefiner(KubeWorkload):
 
+    __slots__ = ()
+
     def __init__(self, data: dict):
         super().__init__(data)
 
@@ -89,10 +107,14 @@ class KubePodDefiner(KubeWorkload):
 
     @property
     def containers(self):
-        return cast_container_list(self.pod_spec.get("containers", []), self)
+        if self._containers is None:
+            self._containers = cast_container_list(self.pod_spec.get("containers", []), self)
+        return self._containers
 
     def set_containers(self, container_list):
         self.data["spec"]["template"]["spec"]["containers"] = container_to_dict(container_list)
+        self._containers = None
+        self.mark_modified()
 
     @property
     def labels(self):
@@ -104,6 +126,7 @@ class KubePodDefiner(KubeWorkload):
 
     def set_host_network(self, host_network: bool):
         self.data["spec"]["template"]["spec"]["hostNetwork"] = host_network
+        self.mark_modified()
 
     @property
     def pod_spec(self):
@@ -113,10 +136,13 @@ class KubePodDefiner(KubeWorkload):
         actual_labels: dict = self.pod_template["metadata"].get("labels", {})
         actual_labels.update(labels)
         self.pod_template["metadata"]["labels"] = actual_labels
+        self.mark_modified()
 
 
 class KubeDeployment(KubePodDefiner):
 
+    __slots__ = ()
+
     def __init__(self, data: dict):
         super().__init__(data)
         self.shortname = KUBE_DEPLOYMENT
@@ -124,6 +150,8 @@ class KubeDeployment(KubePodDefiner):
 
 class KubeReplicaSet(KubePodDefiner):
 
+    __slots__ = ()
+
     def __init__(self, data: dict):
         super().__init__(data)
         self.shortname = KUBE_REPLICASET
@@ -131,6 +159,8 @@ class KubeReplicaSet(KubePodDefiner):
 
 class KubeStatefulSet(KubePodDefiner):
 
+    __slots__ = ()
+
     def __init__(self, data: dict):
         super().__init__(data)
         self.shortname = KUBE_STATEFULSET
@@ -0,0 +1,64 @@
+import re
+import sys
+from functools import lru_cache
+from typing import NamedTuple
+
+from microkure.kmodel.shortnames import ALL_SHORTNAMES
+
+NAME_CACHE_SIZE = 65536
+
+_SHORTNAMES = frozenset(ALL_SHORTNAMES)
+
+# <name>.<namespace>[...]
+_NAMESPACED_NAME_REGEX = re.compile(r"([-\w]+)[.]([-\w]+)")
+
+# <name>.<namespace>.<shortname>.<cluster domain>, e.g. name.namespace.svc.cluster.local
+_FQDN_REGEX = re.compile(r"^[\w\-]+[.][\w\-]+[.](" + "|".join(ALL_SHORTNAMES) + r")[.]\w+[.]\w+")
+
+
+class NameKey(NamedTuple):
+    name: str
+    namespace: str  # Empty if the parsed string does not specify it
+    shortname: str  # Empty if the parsed string does not specify it
+
+    @property
+    def fullname(self):
+        return f"{self.name}.{self.namespace}" if self.namespace else self.name
+
+    @property
+    def typed_fullname(self):
+        return f"{self.fullname}.{self.shortname}" if self.shortname else self.fullname
+
+
+def name_has_namespace(name: str):
+    return _NAMESPACED_NAME_REGEX.match(name) is not None
+
+
+def name_is_FQDN(name: str):
+    return _FQDN_REGEX.match(name) is not None
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def canonical_name(name: str) -> str:
+    """Return the name without its cluster domain, if it is a FQDN, as an interned string."""
+    if name_is_FQDN(name):
+        name = ".".join(name.split(".")[:-2])
+    return sys.intern(name)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def parse_name(name: str) -> NameKey:
+    """Parse a host or object name (<name>[.<namespace>[.<shortname>[.<cluster domain>]]]) into its parts."""
+    parts = canonical_name(name).split(".")
+
+    shortname = ""
+    if len(parts) >= 2 and parts[-1] in _SHORTNAMES:
+        shortname = parts.pop()
+
+    namespace = parts.pop() if len(parts) >= 2 else ""
+    return NameKey(sys.intern(".".join(parts)), sys.intern(namespace), sys.intern(shortname))
+
+
+def qualify_name(name: str, namespace: str) -> str:
+    """Return the name with the given namespace appended, unless it already specifies one."""
+    return name if name_has_namespace(name) else f"{name}.{namespace}"
@@ -0,0 +1,20 @@
+def container_port_keys(ports: list) -> frozenset:
+    """Return the (name-or-number, protocol) keys a service targetPort can refer to for the given container ports."""
+    keys = set()
+    for port in ports:
+        protocol = port.get("protocol", "TCP")
+        for value in [port.get("name", None), port.get("containerPort", None)]:
+            if value is not None:
+                keys.add((value, protocol))
+    return frozenset(keys)
+
+
+def service_port_keys(ports: list) -> frozenset:
+    """Return the (name-or-number, protocol) keys targeted by the given service ports."""
+    keys = set()
+    for port in ports:
+        # If targetPort is not defined, port is considered
+        value = port.get("targetPort", port.get("port", None))
+        if value is not None:
+            keys.add((value, port.get("protocol", "TCP")))
+    return frozenset(keys)
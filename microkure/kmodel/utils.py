@@ -1,7 +1,4 @@
-import re
-
 from microkure.kmodel.kube_container import KubeContainer
-from microkure.kmodel.shortnames import ALL_SHORTNAMES
 
 
 def cast_container_list(container_list, workload):
@@ -18,11 +15,13 @@ def container_to_dict(container_list: list):
     ))
 
 
-def does_selectors_labels_match(selectors: dict, labels: dict):
-    selectors_str = [f"{k}:{v}" for k, v in selectors.items()]
-    labels_str = [f"{k}:{v}" for k, v in labels.items()]
+def label_pairs(labels: dict) -> set:
+    # Tuples, as "key:value" strings of different pairs can be equal (e.g. "a:b" -> "c" and "a" -> "b:c")
+    return {(str(k), str(v)) for k, v in (labels or {}).items()}
 
-    return len([value for value in labels_str if value in selectors_str]) > 0
+
+def does_selectors_labels_match(selectors: dict, labels: dict):
+    return not label_pairs(selectors).isdisjoint(label_pairs(labels))
 
 
 def does_svc_match_ports(service, ports):
@@ -37,14 +36,3 @@ def does_svc_match_ports(service, ports):
                 return True
 
     return False
-
-
-def name_has_namespace(name: str):
-    match = re.match(r"([-\w]+)[.]([-\w]+)", name)
-    return match and match.string == name
-
-
-def name_is_FQDN(name: str):
-    regex = r"^[\w\-]+[.][\w\-]+[.](" + "|".join(ALL_SHORTNAMES) + ")[.]\w+[.]\w+"
-    match = re.match(regex, name)
-    return match and match.string == name
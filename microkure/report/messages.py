@@ -1,5 +1,6 @@
 import os
 
+from microkure import constants
 from microkure.kmodel.kube_istio import KubeIstio
 
 
@@ -30,11 +31,13 @@ def cannot_refactor_model_msg():
 
 
 def created_resource_msg(resource, resource_outfile):
-    return f"Created K8s {_extract_kubernetes_name(resource)} named '{resource.fullname}' ({resource_outfile})"
+    return f"Created K8s {_extract_kubernetes_name(resource)} named '{resource.fullname}' " \
+           f"({_output_path(resource_outfile)})"
 
 
 def resource_modified_msg(resource, resource_outfile):
-    return f"Modified K8s {_extract_kubernetes_name(resource)} named '{resource.fullname}' ({resource_outfile})"
+    return f"Modified K8s {_extract_kubernetes_name(resource)} named '{resource.fullname}' " \
+           f"({_output_path(resource_outfile)})"
 
 
 def resource_deleted_msg(resource):
@@ -42,7 +45,8 @@ def resource_deleted_msg(resource):
 
 
 def removed_exposing_params_msg(workload_fullname, resource_outfile):
-    return f"Removed exposing attributed (hostNetworks and hostPorts) from object '{workload_fullname}' ({resource_outfile})"
+    return f"Removed exposing attributed (hostNetworks and hostPorts) from object '{workload_fullname}' " \
+           f"({_output_path(resource_outfile)})"
 
 
 def cannot_find_nodes_msg(node_names: list):
@@ -63,3 +67,10 @@ def _extract_kubernetes_name(resource):
         istio = "Istio"
 
     return f"{istio}{resource.__class__.__name__[4:]}"
+
+
+def _output_path(resource_outfile):
+    # Relative to the output folder, as the folder is renamed when published and may be given a suffix
+    if not resource_outfile:
+        return resource_outfile
+    return os.path.relpath(resource_outfile, constants.OUTPUT_FOLDER).replace(os.sep, "/")
@@ -1,6 +1,7 @@
 from microfreshener.core.analyser.smell import NodeSmell, GroupSmell
 
-from microkure.constants import REPORT_OUTPUT_FOLDER
+from microkure import constants
+from microkure.utils.output_index import write_output
 from microkure.utils.utils import create_folder
 
 
@@ -11,7 +12,7 @@ class ReportExporter:
 
     def __init__(self, filename):
         self.report = ""
-        self.export_file = f"{REPORT_OUTPUT_FOLDER}/{filename}"
+        self.export_file = f"{constants.REPORT_OUTPUT_FOLDER}/{filename}"
 
     @staticmethod
     def export(self, report):
@@ -19,8 +20,7 @@ class ReportExporter:
 
     def _write_to_file(self):
         create_folder(self.export_file)
-        with open(self.export_file, "w") as report_file:
-            report_file.write(self.report)
+        write_output(self.export_file, self.report)
 
 
 class RefactoringCSVReportExporter(ReportExporter):
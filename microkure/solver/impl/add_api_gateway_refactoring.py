@@ -46,7 +46,7 @@ class AddAPIGatewayRefactoring(Refactoring):
                 if expose_svc and expose_svc.is_reachable_from_outside():
                     for port in ports_to_expose:
                         port["node_port"] = convert_port_to_nodeport(expose_svc, port["node_port"])
-                        expose_svc.ports.append(port)
+                        expose_svc.add_port(port)
                     self._refactor_model(expose_svc, smell.node, service_exists=True)
 
                     # Update report row
@@ -96,9 +96,7 @@ class AddAPIGatewayRefactoring(Refactoring):
                 if not pending_action in self.solver_pending_ops_ref:
                     self.solver_pending_ops_ref.append(pending_action)
         else:
-            for port in container.ports:
-                if port.get("hostPort"):
-                    del port["hostPort"]
+            container.remove_host_ports()
 
     def _refactor_model(self, k_service: KubeService, node, service_exists: bool):
         mr_node = self.model.get_node_by_name(k_service.typed_fullname) if service_exists else MessageRouter(k_service.typed_fullname)
@@ -112,7 +110,8 @@ class AddAPIGatewayRefactoring(Refactoring):
             self.model.add_interaction(source_node=mr_node, target_node=node)
 
     def _search_for_existing_svc(self, workload, ports_considered):
-        services = [s for s in self.cluster.services if s.can_expose_workload(workload, ports_considered)]
+        services = [s for s in self.cluster.find_svc_selecting_workload(workload)
+                    if s.can_expose_workload(workload, ports_considered)]
 
         if len(services) == 0:
             return None
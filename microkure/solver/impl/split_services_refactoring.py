@@ -41,7 +41,7 @@ class SplitServicesRefactoring(Refactoring):
             for container in workload.containers.copy():
                 object_copy = copy.deepcopy(workload)
                 object_copy.set_containers([container])
-                object_copy.data["metadata"]["name"] = f"{container.name}-{object_copy.data['metadata']['name']}"
+                object_copy.set_name(f"{container.name}-{object_copy.name}")
 
                 if self._refactor_model(container, object_copy):
                     exp = ExportObject(object_copy, None)
@@ -0,0 +1,82 @@
+import io
+import os
+import shutil
+import tarfile
+import time
+import zipfile
+
+TAR_EXTENSIONS = (".tar.gz", ".tgz", ".tar")
+ZIP_EXTENSIONS = (".zip",)
+
+
+def is_archive(path):
+    return os.path.isfile(path) and path.lower().endswith(TAR_EXTENSIONS + ZIP_EXTENSIONS)
+
+
+def is_zip(path):
+    return path.lower().endswith(ZIP_EXTENSIONS)
+
+
+def _member_name(name):
+    return name[2:] if name.startswith("./") else name
+
+
+class ArchiveReader:
+    """Sequential reader of the regular files of a tar (optionally gzipped) or zip archive."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._archive = zipfile.ZipFile(path) if is_zip(path) else tarfile.open(path, "r:*")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._archive.close()
+
+    def members(self):
+        """Yield the name, the size and an open binary stream of each file of the archive, in archive order."""
+        if isinstance(self._archive, zipfile.ZipFile):
+            for info in self._archive.infolist():
+                if not info.is_dir():
+                    with self._archive.open(info) as stream:
+                        yield _member_name(info.filename), info.file_size, stream
+        else:
+            # Members are read while the (possibly compressed) archive is scanned, without seeking back
+            for info in self._archive:
+                if info.isfile():
+                    with self._archive.extractfile(info) as stream:
+                        yield _member_name(info.name), info.size, stream
+
+
+class ArchiveWriter:
+    """Writer of a zip archive, or of a gzipped tar archive, depending on the extension of its path."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._archive = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) if is_zip(path) \
+            else tarfile.open(path, "w:gz")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._archive.close()
+
+    def add(self, name: str, content: bytes):
+        if isinstance(self._archive, zipfile.ZipFile):
+            self._archive.writestr(name, content)
+        else:
+            self.add_stream(name, len(content), io.BytesIO(content))
+
+    def add_stream(self, name: str, size: int, stream):
+        """Copy a binary stream into the archive, without holding its whole content in memory."""
+        if isinstance(self._archive, zipfile.ZipFile):
+            with self._archive.open(name, "w", force_zip64=size >= zipfile.ZIP64_LIMIT) as f:
+                shutil.copyfileobj(stream, f)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = size
+            info.mtime = time.time()
+            info.mode = 0o644
+            self._archive.addfile(info, stream)
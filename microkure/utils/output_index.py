@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+
+from microkure.utils.utils import copy_file, COPY
+
+# Written in the output root, it lists the files of the last output folder published there
+INDEX_FILENAME = "output_index.json"
+
+HASH_CHUNK_SIZE = 2 ** 20  # bytes
+
+
+class OutputIndex:
+    """
+    Content-addressed index of the files of an output folder. Each file is hashed before being written, and if the
+    last output folder published in the same output root has the same file with the same hash, the file is hard
+    linked to it instead of being written again.
+    """
+
+    def __init__(self, output_root: str, staging_folder: str):
+        self.path = os.path.join(output_root, INDEX_FILENAME)
+        self.output_root = output_root
+        self.staging_folder = staging_folder
+        self.hashes = {}
+        self.reused = 0
+        self.previous_folder, self.previous_hashes = self._load()
+
+    def _load(self) -> tuple:
+        try:
+            with open(self.path) as f:
+                index = json.load(f)
+            return os.path.join(self.output_root, index["folder"]), dict(index["files"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None, {}
+
+    def write(self, path: str, content: str):
+        digest = hashlib.sha256(content.encode()).hexdigest()
+        if not self._link_previous(path, digest):
+            with open(path, "w") as f:
+                f.write(content)
+
+    def copy(self, source: str, path: str, mode: str = COPY):
+        if not self._link_previous(path, _file_digest(source)):
+            copy_file(source, path, mode)
+
+    def _link_previous(self, path: str, digest: str) -> bool:
+        relative = os.path.relpath(path, self.staging_folder).replace(os.sep, "/")
+        self.hashes[relative] = digest
+
+        # Never written through, as the file may be a link to a file of a previous output folder
+        if os.path.lexists(path):
+            os.remove(path)
+
+        if self.previous_folder and self.previous_hashes.get(relative) == digest:
+            try:
+                os.link(os.path.join(self.previous_folder, relative), path)
+                self.reused += 1
+                return True
+            except OSError:
+                pass
+        return False
+
+    def save(self, published_folder: str):
+        """Record the hashes of the files of the published output folder, replacing the previous index."""
+        index = {"folder": os.path.relpath(published_folder, self.output_root),
+                 "files": dict(sorted(self.hashes.items()))}
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(index, f, indent=4)
+        os.replace(temp_path, self.path)
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# The index the output files are written through, if any
+_output_index = None
+
+
+def set_output_index(output_index: OutputIndex = None):
+    global _output_index
+    _output_index = output_index
+
+
+def write_output(path: str, content: str):
+    """Write an output file, through the output index when one is set."""
+    if _output_index:
+        _output_index.write(path, content)
+    else:
+        with open(path, "w") as f:
+            f.write(content)
+
+
+def copy_output(source: str, path: str, mode: str = COPY):
+    if _output_index:
+        _output_index.copy(source, path, mode)
+    else:
+        copy_file(source, path, mode)
@@ -1,36 +1,253 @@
+import errno
+import json
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
 
 import yaml
-from yaml import SafeLoader
+
+try:
+    # libyaml based loader and dumper, available when PyYAML has been built against it
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+try:
+    # Faster JSON parser, used when installed
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Folders and files never containing Kubernetes deploy files
+DEFAULT_IGNORED_NAMES = frozenset({".git", ".hg", ".svn", "node_modules", "__pycache__", ".idea", ".vscode", ".venv",
+                                   ".DS_Store"})
+
+# Ways of exporting a file that is not changed
+COPY, HARDLINK, REFLINK, SYMLINK = "copy", "hardlink", "reflink", "symlink"
+LINK_MODES = [COPY, HARDLINK, REFLINK, SYMLINK]
+
+# Long lines are never folded, as libyaml and the pure-Python emitter fold them differently
+YAML_DUMP_WIDTH = 2 ** 31 - 1
 
 
 def create_folder(path):
-    file_folder = f"./{os.path.dirname(path)}"
+    file_folder = os.path.dirname(path) or "."
     if not os.path.exists(file_folder):
-        os.makedirs(file_folder, 0o777)
+        os.makedirs(file_folder, 0o777, exist_ok=True)
+
+
+def sync_folder(folder: str, workers: int = 8):
+    """Flush to disk all the files written in the folder and its subfolders, and then the folders themselves."""
+    files, folders = list(), list()
+    for path, _, fnames in os.walk(folder):
+        folders.append(path)
+        files += [os.path.join(path, file) for file in fnames if not os.path.islink(os.path.join(path, file))]
+
+    # fsync waits for the disk without holding the GIL, so files are flushed in parallel
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_fsync, files))
+    for path in reversed(folders):
+        _fsync(path)
+
+
+def publish_folder(staging_folder: str, folder: str) -> str:
+    """
+    Atomically move a completely written staging folder to its final path, so that the folder is never seen partially
+    written. If the final path already exists, a numeric suffix is added to it. Return the final path.
+    """
+    sync_folder(staging_folder)
+
+    destination, count = folder, 1
+    while True:
+        if not os.path.exists(destination):
+            try:
+                os.rename(staging_folder, destination)
+                break
+            except OSError as err:
+                # The path has been taken since the check (e.g. by a concurrent run): rename never replaces a non-empty
+                # folder, but on POSIX systems an empty folder created in the meantime is replaced
+                if err.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                    raise
+        count += 1
+        destination = f"{folder}-{count}"
+
+    _fsync(os.path.dirname(os.path.abspath(destination)))
+    return destination
 
 
-def get_filenames_from_directory(path: str) -> list:
-    path = path if path.endswith("/") else f"{path}/"
+def _fsync(path: str):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # e.g. folders cannot be synced on Windows
+    finally:
+        os.close(fd)
+
+
+def get_filenames_from_directory(path: str, include: list = None, exclude: list = None,
+                                 ignored=DEFAULT_IGNORED_NAMES) -> list:
+    """
+    Return the paths, relative to the folder, of the files in the folder and its subfolders, in the same order of
+    os.walk. Files and folders whose name is in ignored, or whose relative path or name matches one of the exclude glob
+    patterns, are skipped. If include patterns are given, only the files matching one of them are returned.
+    """
     files = list()
-    for folder, _, fnames in os.walk(path):
-        for file in fnames:
-            final_name = folder + "/" + file
-            final_name = final_name.replace(path, "")
-            final_name = final_name[1:] if final_name.startswith("/") else final_name
-            files.append(final_name)
+    folders = [""]
+    while folders:
+        folder = folders.pop()
+        try:
+            entries = list(os.scandir(os.path.join(path, folder)))
+        except OSError:
+            continue
+
+        subfolders = list()
+        for entry in entries:
+            name = f"{folder}/{entry.name}" if folder else entry.name
+            if entry.name in ignored or _matches(name, entry.name, exclude):
+                continue
+
+            if entry.is_dir():
+                # As in os.walk, symbolic links to folders are not followed
+                if not entry.is_symlink():
+                    subfolders.append(name)
+            elif not include or _matches(name, entry.name, include):
+                files.append(name)
+
+        folders += reversed(subfolders)
     return files
 
 
+def is_filename_selected(name: str, include: list = None, exclude: list = None, ignored=DEFAULT_IGNORED_NAMES) -> bool:
+    """Apply the filters of get_filenames_from_directory to a single relative path, and to its parent folders."""
+    parts = name.split("/")
+    for i, part in enumerate(parts):
+        if part in ignored or _matches("/".join(parts[:i + 1]), part, exclude):
+            return False
+    return not include or _matches(name, parts[-1], include)
+
+
+def _matches(name, basename, patterns) -> bool:
+    return bool(patterns) and any(fnmatch(name, p) or fnmatch(basename, p) for p in patterns)
+
+
+def copy_file(source: str, destination: str, mode: str = COPY):
+    """
+    Copy a file, or link it to the destination when the mode is a link mode. If the link cannot be created (e.g. the
+    file system does not support it, or the files are on different devices) the file is copied.
+    """
+    try:
+        if mode == HARDLINK:
+            os.link(source, destination)
+            return
+        elif mode == SYMLINK:
+            os.symlink(os.path.abspath(source), destination)
+            return
+        elif mode == REFLINK:
+            _reflink(source, destination)
+            return
+    except (OSError, AttributeError):
+        pass
+    shutil.copy(source, destination)
+
+
+def _reflink(source: str, destination: str):
+    import fcntl  # Not available on Windows
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        # FICLONE, supported on Linux by copy-on-write file systems like Btrfs and XFS
+        fcntl.ioctl(dst.fileno(), 0x40049409, src.fileno())
+    shutil.copymode(source, destination)
+
+
 def is_yaml(filename):
     return filename.lower().endswith(".yaml") or filename.lower().endswith(".yml")
 
 
+def is_json(filename):
+    return filename.lower().endswith(".json")
+
+
 def read_data_from_file(filename) -> list:
-    read_data = list()
     with open(filename) as f:
+        return read_data_from_stream(f, filename)
+
+
+def read_data_from_stream(stream, filename) -> list:
+    read_data = list()
+    try:
+        read_data = list(yaml.load_all(stream, Loader=YamlLoader))
+    except yaml.YAMLError as err:
+        print("Exception while reading file: {} (error: {})".format(filename, err))
+    return [i for i in read_data if i is not None]
+
+
+def read_data_from_json_file(filename) -> list:
+    with open(filename, "rb") as f:
+        return read_data_from_json_stream(f, filename)
+
+
+def read_data_from_json_stream(stream, filename) -> list:
+    read_data = list()
+    try:
+        read_data = json_loads(stream.read())
+    except ValueError as err:
+        print("Exception while reading file: {} (error: {})".format(filename, err))
+    read_data = read_data if isinstance(read_data, list) else [read_data]
+    return [i for i in read_data if i is not None]
+
+
+def dump_yaml(content, dumper=YamlDumper) -> str:
+    return yaml.dump(content, Dumper=dumper, sort_keys=False, width=YAML_DUMP_WIDTH)
+
+
+def dump_json(content) -> str:
+    return json.dumps(content, indent=4, ensure_ascii=False) + "\n"
+
+
+def iter_document_nodes(filename):
+    """
+    Lazily yield the loader and the root node of each non-empty document of a YAML file. Newlines are not translated,
+    so that the node marks are the character offsets of the file content.
+    """
+    with open(filename, newline="") as f:
+        loader = YamlLoader(f)
         try:
-            read_data = list(yaml.load_all(f, Loader=SafeLoader))
+            while loader.check_node():
+                node = loader.get_node()
+                if node is not None and node.tag != "tag:yaml.org,2002:null":
+                    yield loader, node
         except yaml.YAMLError as err:
             print("Exception while reading file: {} (error: {})".format(filename, err))
-    return [i for i in read_data if i is not None]
\ No newline at end of file
+        finally:
+            loader.dispose()
+
+
+def get_document_spans(text: str) -> list:
+    """
+    Return the start and end character offsets of the content of each non-empty document of a YAML text, composing
+    the documents without constructing them.
+    """
+    spans = list()
+    loader = YamlLoader(text)
+    try:
+        while loader.check_node():
+            node = loader.get_node()
+            if node is not None and node.tag != "tag:yaml.org,2002:null":
+                spans.append((node.start_mark.index, node.end_mark.index))
+    finally:
+        loader.dispose()
+    return spans
+
+
+def get_node_kind(node):
+    """Return the kind of the document having the given root node, without constructing it."""
+    if isinstance(node, yaml.MappingNode):
+        for key_node, value_node in node.value:
+            if key_node.value == "kind" and isinstance(value_node, yaml.ScalarNode):
+                return value_node.value
+    return None
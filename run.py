@@ -1,5 +1,6 @@
 import copy
 import os.path
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 from microfreshener.core.analyser import MicroToscaAnalyserBuilder
@@ -10,18 +11,23 @@ from microfreshener.core.exporter import YMLExporter
 from microfreshener.core.importer import YMLImporter
 from microfreshener.core.logging import MyLogger
 
-from microkure.constants import IGNORE_CONFIG_SCHEMA_FILE, TOSCA_OUTPUT_FOLDER
+from microkure import constants
+from microkure.constants import IGNORE_CONFIG_SCHEMA_FILE
+from microkure.exporter.overlay_exporter import OverlayKExporter
 from microkure.exporter.yamlkexporter import YamlKExporter
 from microkure.extender.extender import KubeExtender
 from microkure.extender.name_adjuster import NameAdjuster
 from microkure.extender.worker_names import NAME_WORKER
 from microkure.ignorer.impl.ignore_config import IgnoreConfig, IgnoreType
 from microkure.ignorer.impl.ignore_nothing import IgnoreNothing
+from microkure.importer.parse_cache import ParseCache
 from microkure.importer.yamlkimporter import YamlKImporter
 from microkure.report.report import RefactoringReport
 
 from microkure.solver.solver import Solver, KubeSolver
-from microkure.utils.utils import create_folder
+from microkure.utils.archive import is_archive
+from microkure.utils.output_index import OutputIndex, set_output_index, write_output
+from microkure.utils.utils import create_folder, publish_folder, COPY, LINK_MODES
 
 SELECT_ALL = "all"
 
@@ -30,11 +36,22 @@ REFACTORING = ["add_api_gateway", "add_ag", "add_circuit_breaker", "add_cb", "ad
 
 
 @click.command()
-@click.option("--kubepath", "--kube", required=True, type=str, help="Folder containing Kubernetes deploy files of the system")
+@click.option("--kubepath", "--kube", required=True, type=str, help="Folder (or .tar.gz/.zip archive) containing Kubernetes deploy files of the system")
 @click.option("--modelpath", "--model", required=True, type=str, help="MicroTosca file containing the description of the system")
 @click.option("--refactoring", "-r", default=["all"], type=click.Choice(REFACTORING), help="Select and apply one refactoring. This option can be used multiple times, for executing multiple refactoring", multiple=True)
 @click.option("--ignore_config", "-ig", type=str, help="The file that specifies which smell, refactoring or worker ignore")
-def run(kubepath, modelpath, refactoring: list, ignore_config):
+@click.option("--import_workers", "-w", default=1, type=click.IntRange(min=1), help="Number of processes used for parsing the Kubernetes files")
+@click.option("--parse_cache", "-pc", type=str, help="Folder where parsed Kubernetes files are cached between runs")
+@click.option("--parse_cache_size", default=ParseCache.DEFAULT_MAX_SIZE // 2 ** 20, type=click.IntRange(min=0), help="Maximum size of the parse cache, in MB")
+@click.option("--reference_unsupported", is_flag=True, help="Do not parse documents of unsupported kinds, they are exported as they are")
+@click.option("--export_workers", "-ew", default=1, type=click.IntRange(min=1), help="Number of processes used for writing the Kubernetes files")
+@click.option("--link_mode", "-lm", default=COPY, type=click.Choice(LINK_MODES), help="How files not modified by microkure are exported: copied, or linked to their source (falling back to a copy)")
+@click.option("--output", "-o", default="./out", type=str, help="Folder where the output folder of the run is created")
+@click.option("--output_index", is_flag=True, help="Hash the output files, and hard link the ones equal to the previous run in the 'output' folder instead of writing them again")
+@click.option("--overlay", is_flag=True, help="Export only the changes to the Kubernetes files, as a kustomize overlay of the 'kube' folder")
+@click.option("--include", "-i", multiple=True, type=str, help="Glob pattern of the Kubernetes files to import. This option can be used multiple times")
+@click.option("--exclude", "-e", multiple=True, type=str, help="Glob pattern of the files or folders to skip while importing. This option can be used multiple times")
+def run(kubepath, modelpath, refactoring: list, ignore_config, import_workers, parse_cache, parse_cache_size, reference_unsupported, include, exclude, export_workers, link_mode, overlay, output, output_index):
 
     if not os.path.exists(kubepath):
         raise ValueError(f"Kubernetes deployment path passed as 'kube' parameter ({kubepath}) not found")
@@ -42,14 +59,28 @@ def run(kubepath, modelpath, refactoring: list, ignore_config):
     if not os.path.exists(modelpath):
         raise ValueError(f"MicroTosca model path passed as 'model' parameter ({modelpath}) not found")
 
+    if reference_unsupported and (import_workers > 1 or parse_cache):
+        raise ValueError("Unsupported documents can be referenced ('reference_unsupported') only by a serial import "
+                         "without parse cache")
+
+    if overlay and is_archive(kubepath):
+        raise ValueError(f"An overlay cannot be exported for an archive ({kubepath})")
+
     if not os.path.exists(modelpath):
         raise ValueError(f"File passed as ignore config ({ignore_config}) not found")
 
+    # Output is written to a staging folder, published at the end of the run
+    constants.set_output_root(output, staging=True)
+    index = OutputIndex(constants.OUTPUT_ROOT, constants.OUTPUT_FOLDER) if output_index else None
+    set_output_index(index)
+
     # Import model
     model = YMLImporter().Import(modelpath)
 
     # Import Kubernetes Cluster
-    importer = YamlKImporter()
+    cache = ParseCache(parse_cache, parse_cache_size * 2 ** 20) if parse_cache else None
+    importer = YamlKImporter(workers=import_workers, cache=cache, unsupported_as_reference=reference_unsupported,
+                             include=list(include), exclude=list(exclude))
     cluster = importer.Import(kubepath)
 
     # Run name worker before everything
@@ -98,11 +129,29 @@ def run(kubepath, modelpath, refactoring: list, ignore_config):
 
     # Export files
     adjuster.adjust(model)
-    exporter = YamlKExporter()
-    exporter.export(cluster, model, tosca_model_filename=modelpath)
+    if overlay:
+        exporter = OverlayKExporter(kubepath, workers=export_workers)
+    else:
+        exporter = YamlKExporter(only_modified=True, source_archive=kubepath if is_archive(kubepath) else None,
+                                 workers=export_workers, link_mode=link_mode)
+    if export_workers > 1:
+        # Export report while files are exported
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            report_export = executor.submit(RefactoringReport().export)
+            exporter.export(cluster, model, tosca_model_filename=modelpath)
+            report_export.result()
+    else:
+        exporter.export(cluster, model, tosca_model_filename=modelpath)
+
+        # Export report
+        RefactoringReport().export()
+
+    output_folder = publish_folder(constants.OUTPUT_FOLDER, constants.PUBLISHED_OUTPUT_FOLDER)
+    MyLogger().get_logger().info(f"Output written to {output_folder}")
 
-    # Export report
-    RefactoringReport().export()
+    if index:
+        index.save(output_folder)
+        MyLogger().get_logger().info(f"{index.reused} of {len(index.hashes)} output files unchanged since the previous run")
 
 
 def ignore_smells(smells, ignorer):
@@ -115,11 +164,10 @@ def export_extended_model(model, adjuster):
     adjuster.adjust(model_copy)
 
     tosca_model_str = YMLExporter().Export(model_copy)
-    tosca_output_filename = f"{TOSCA_OUTPUT_FOLDER}/extended-only-model.yml"
+    tosca_output_filename = f"{constants.TOSCA_OUTPUT_FOLDER}/extended-only-model.yml"
 
     create_folder(tosca_output_filename)
-    with open(tosca_output_filename, "w") as f:
-        f.write(tosca_model_str)
+    write_output(tosca_output_filename, tosca_model_str)
 
 
 def build_analyser(model, ignore_config):
@@ -0,0 +1,67 @@
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from unittest import TestCase
+
+from microkure import constants
+from microkure.exporter.yamlkexporter import YamlKExporter
+from microkure.importer.yamlkimporter import YamlKImporter
+from microkure.utils.archive import ArchiveReader
+
+
+class TestArchiveImport(TestCase):
+
+    TEST_FILES_PATH_KUBE = os.path.join(os.path.dirname(__file__), "..", "..", "data", "examples", "MFDemo",
+                                        "kubernetes")
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        constants.set_output_root(os.path.join(self.folder, "out"))
+
+        self.tar_path = os.path.join(self.folder, "deploy.tar.gz")
+        with tarfile.open(self.tar_path, "w:gz") as tar:
+            tar.add(self.TEST_FILES_PATH_KUBE, arcname=".")
+
+        self.zip_path = os.path.join(self.folder, "deploy.zip")
+        with zipfile.ZipFile(self.zip_path, "w") as zip_file:
+            for folder, _, fnames in os.walk(self.TEST_FILES_PATH_KUBE):
+                for file in fnames:
+                    path = os.path.join(folder, file)
+                    zip_file.write(path, os.path.relpath(path, self.TEST_FILES_PATH_KUBE))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+        constants.set_output_root("./out")
+
+    def _members(self, path):
+        with ArchiveReader(path) as archive:
+            return {file: stream.read() for file, _, stream in archive.members()}
+
+    def test_import(self):
+        expected = YamlKImporter().Import(self.TEST_FILES_PATH_KUBE)
+        self.assertTrue(expected.cluster_objects)
+
+        for path in [self.tar_path, self.zip_path]:
+            cluster = YamlKImporter().Import(path)
+            self.assertEqual(sorted(o.typed_fullname for o in cluster.cluster_objects),
+                             sorted(o.typed_fullname for o in expected.cluster_objects))
+            self.assertEqual(sorted(e.filename for e in cluster.cluster_export_info),
+                             sorted(e.filename for e in expected.cluster_export_info))
+
+    def test_export(self):
+        for path, extension in [(self.tar_path, ".tar.gz"), (self.zip_path, ".zip")]:
+            cluster = YamlKImporter().Import(path)
+            modified = cluster.workloads[0]
+            modified.set_host_network(True)
+
+            YamlKExporter(only_modified=True, source_archive=path)._export_archive(cluster)
+
+            source, exported = self._members(path), self._members(constants.DEPLOY_OUTPUT_FOLDER + extension)
+            self.assertEqual(exported.keys(), {e.filename for e in cluster.cluster_export_info})
+            for file in exported:
+                if file == modified.export_filename:
+                    self.assertIn(b"hostNetwork: true", exported[file])
+                else:
+                    self.assertEqual(source[file], exported[file])
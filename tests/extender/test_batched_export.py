@@ -0,0 +1,62 @@
+import builtins
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from microkure import constants
+from microkure.exporter.export_object import group_by_file
+from microkure.exporter.yamlkexporter import YamlKExporter
+from microkure.importer.yamlkimporter import YamlKImporter
+from microkure.utils.utils import read_data_from_file
+
+
+class TestBatchedExport(TestCase):
+
+    TEST_FILES_PATH_KUBE = os.path.join(os.path.dirname(__file__), "..", "..", "data", "examples")
+
+    def setUp(self):
+        # Output paths are computed on import, so the output root is set first
+        self.folder = tempfile.mkdtemp()
+        constants.set_output_root(os.path.join(self.folder, "out"))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+        constants.set_output_root("./out")
+
+    def _import(self):
+        cluster = YamlKImporter().Import(self.TEST_FILES_PATH_KUBE)
+        self.assertTrue(cluster.cluster_objects)
+        return cluster
+
+    def test_export(self):
+        cluster = self._import()
+        files = group_by_file(cluster.cluster_export_info)
+
+        with patch("builtins.open", wraps=builtins.open) as open_mock:
+            YamlKExporter()._export_objects(cluster.cluster_export_info)
+        written = [c.args[0] for c in open_mock.call_args_list if c.args[1:] == ("w",)]
+        self.assertTrue(written)
+        self.assertEqual(sorted(written), sorted(f for f, objs in files.items() if objs[0].kube_object is not None))
+
+        for out_fullname in written:
+            self.assertEqual(read_data_from_file(out_fullname), [e.content for e in files[out_fullname]])
+
+    def test_parallel_export(self):
+        cluster = self._import()
+        for workload in cluster.workloads[::2]:
+            workload.set_host_network(True)
+        out_fullnames = list(group_by_file(cluster.cluster_export_info))
+
+        outputs = []
+        for workers in [1, 4]:
+            shutil.rmtree(constants.DEPLOY_OUTPUT_FOLDER, ignore_errors=True)
+            YamlKExporter(only_modified=True, workers=workers)._export_modified_files(cluster)
+            outputs.append([self._read_bytes(out_fullname) for out_fullname in out_fullnames])
+
+        self.assertEqual(outputs[0], outputs[1])
+
+    def _read_bytes(self, path):
+        with open(path, "rb") as f:
+            return f.read()
@@ -0,0 +1,43 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from microkure.utils.utils import get_filenames_from_directory, is_filename_selected
+
+
+class TestDirectoryScan(TestCase):
+
+    FILES = ["deploy.yaml", "svc.yml", "README.md", "charts/app/templates/pod.yaml", "charts/app/tests/test.yaml",
+             "charts/app/chart.tgz", ".git/config", "node_modules/lib/package.json", "sub/.git/HEAD"]
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        for file in self.FILES:
+            os.makedirs(os.path.join(self.folder, os.path.dirname(file)), exist_ok=True)
+            open(os.path.join(self.folder, file), "w").close()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _walk(self):
+        files = []
+        for folder, _, fnames in os.walk(self.folder):
+            files += [os.path.relpath(os.path.join(folder, file), self.folder) for file in fnames]
+        return files
+
+    def test_same_as_walk(self):
+        self.assertEqual(get_filenames_from_directory(self.folder, ignored=()), self._walk())
+        self.assertEqual(get_filenames_from_directory(self.folder + "/", ignored=()), self._walk())
+
+    def test_default_ignored(self):
+        self.assertEqual(sorted(get_filenames_from_directory(self.folder)),
+                         sorted(["deploy.yaml", "svc.yml", "README.md", "charts/app/templates/pod.yaml",
+                                 "charts/app/tests/test.yaml", "charts/app/chart.tgz"]))
+
+    def test_include_exclude(self):
+        files = get_filenames_from_directory(self.folder, include=["*.yaml", "*.yml"], exclude=["charts/*/tests"])
+        self.assertEqual(sorted(files), ["charts/app/templates/pod.yaml", "deploy.yaml", "svc.yml"])
+
+        for file in self.FILES:
+            self.assertEqual(is_filename_selected(file, ["*.yaml", "*.yml"], ["charts/*/tests"]), file in files)
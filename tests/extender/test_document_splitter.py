@@ -0,0 +1,61 @@
+import glob
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+
+from microkure.importer.document_splitter import split_documents, read_data_from_large_file
+from microkure.utils.utils import read_data_from_file
+
+
+class TestDocumentSplitter(TestCase):
+
+    TEST_FILES_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "examples")
+    WORKERS = 4
+
+    def setUp(self):
+        examples = sorted(glob.glob(f"{self.TEST_FILES_PATH}/**/*.y*ml", recursive=True))
+        self.assertGreater(len(examples), 0)
+
+        fd, self.file = tempfile.mkstemp(suffix=".yaml")
+        with os.fdopen(fd, "w") as f:
+            for i, example in enumerate(examples):
+                with open(example) as e:
+                    f.write(f"---\n# {example}\n{e.read()}\n")
+                if i % 5 == 0:
+                    f.write("---\n---\nvalue: |\n  --- not a document start\n...\n")
+
+    def tearDown(self):
+        os.remove(self.file)
+
+    def _write(self, content):
+        with open(self.file, "w") as f:
+            f.write(content)
+
+    def test_split(self):
+        ranges = split_documents(self.file, self.WORKERS)
+        self.assertTrue(1 < len(ranges) <= self.WORKERS)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], os.path.getsize(self.file))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+
+    def test_same_documents(self):
+        with ProcessPoolExecutor(max_workers=self.WORKERS) as executor:
+            self.assertEqual(read_data_from_large_file(self.file, executor, self.WORKERS),
+                             read_data_from_file(self.file))
+
+    def test_not_split(self):
+        self._write("%YAML 1.1\n---\na: 1\n---\nb: 2\n")
+        self.assertEqual(split_documents(self.file, self.WORKERS), [(0, os.path.getsize(self.file))])
+
+    def test_empty_file(self):
+        self._write("")
+        self.assertEqual(split_documents(self.file, self.WORKERS), [(0, 0)])
+        with ProcessPoolExecutor(max_workers=self.WORKERS) as executor:
+            self.assertEqual(read_data_from_large_file(self.file, executor, self.WORKERS), [])
+
+    def test_invalid_file(self):
+        self._write("a: 1\n---\nb: [\n" * 10)
+        with ProcessPoolExecutor(max_workers=self.WORKERS) as executor:
+            self.assertEqual(read_data_from_large_file(self.file, executor, self.WORKERS), read_data_from_file(self.file))
@@ -11,7 +11,7 @@ from microkure.importer.yamlkimporter import YamlKImporter
 
 class TestImporterExporter(TestCase):
 
-    TEST_FILES_PATH = "./data/import_export_test_files"
+    TEST_FILES_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "import_export_test_files")
     TEST_FILES_PATH_KUBE = f"{TEST_FILES_PATH}/deploy"
     TEST_FILES_PATH_TOSCA = f"{TEST_FILES_PATH}/helloworld.yml"
     NEW_NAME_STR = f"NEW-{uuid.uuid4().hex}"
@@ -0,0 +1,91 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from microkure import constants
+from microkure.exporter.yamlkexporter import YamlKExporter
+from microkure.importer.yamlkimporter import YamlKImporter
+from microkure.kmodel.kube_networking import KubeService
+from microkure.kmodel.kube_workload import KubeDeployment, KubePod
+from microkure.utils.utils import read_data_from_json_file
+
+
+class TestJsonImport(TestCase):
+
+    POD = {"apiVersion": "v1", "kind": "Pod", "metadata": {"name": "pod"},
+           "spec": {"containers": [{"name": "container", "image": "image"}]}}
+    SERVICE = {"apiVersion": "v1", "kind": "Service", "metadata": {"name": "svc"}, "spec": {"selector": {"a": "b"}}}
+    CONFIG_MAP = {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "config"}, "data": {"key": "value"}}
+    DEPLOYMENT = {"apiVersion": "apps/v1", "kind": "Deployment", "metadata": {"name": "deploy"},
+                  "spec": {"template": {"metadata": {"labels": {"a": "b"}}, "spec": {"containers": []}}}}
+
+    LIST = {"apiVersion": "v1", "kind": "List", "metadata": {"resourceVersion": "1"}, "items": [
+        POD, {"apiVersion": "v1", "kind": "ServiceList", "items": [SERVICE]}, CONFIG_MAP]}
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self._write("list.json", self.LIST)
+        self._write("deploy.json", self.DEPLOYMENT)
+        constants.set_output_root(os.path.join(self.folder, "out"))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+        constants.set_output_root("./out")
+
+    def _write(self, filename, content):
+        with open(os.path.join(self.folder, filename), "w") as f:
+            json.dump(content, f)
+
+    def test_import(self):
+        cluster = YamlKImporter().Import(self.folder)
+
+        self.assertEqual(sorted(type(o).__name__ for o in cluster.cluster_objects),
+                         sorted([KubePod.__name__, KubeService.__name__, KubeDeployment.__name__]))
+        self.assertEqual([(e.filename, e.content) for e in cluster.cluster_export_info if e.filename == "list.json"],
+                         [("list.json", self.POD), ("list.json", self.SERVICE), ("list.json", self.CONFIG_MAP)])
+
+    def _export(self, cluster, filename):
+        export_objects = [e for e in cluster.cluster_export_info if e.filename == filename]
+        YamlKExporter()._export_objects(export_objects)
+        return read_data_from_json_file(export_objects[0].out_fullname)
+
+    def test_export(self):
+        cluster = YamlKImporter().Import(self.folder)
+        self.assertEqual(self._export(cluster, "list.json"), [self.LIST])
+        self.assertEqual(self._export(cluster, "deploy.json"), [self.DEPLOYMENT])
+
+    def test_export_keeps_list_wrapper(self):
+        cluster = YamlKImporter().Import(self.folder)
+        k_pod = next(o for o in cluster.cluster_objects if isinstance(o, KubePod))
+        k_pod.set_labels({"app": "pod"})
+
+        exported = self._export(cluster, "list.json")[0]
+        self.assertEqual({k: v for k, v in exported.items() if k != "items"},
+                         {k: v for k, v in self.LIST.items() if k != "items"})
+        self.assertEqual(exported["items"][0]["metadata"]["labels"], {"app": "pod"})
+        self.assertEqual(exported["items"][1:], self.LIST["items"][1:])
+
+        # Without one of its objects, the List keeps its wrapper
+        k_svc = next(o for o in cluster.cluster_objects if isinstance(o, KubeService))
+        cluster.remove_object(k_svc)
+        exported = self._export(cluster, "list.json")[0]
+        self.assertEqual(exported["metadata"], self.LIST["metadata"])
+        self.assertEqual([item["kind"] for item in exported["items"]], ["Pod", "ConfigMap"])
+
+    def test_files_without_kube_objects_are_copied(self):
+        files = {"package.json": '{"name":  "app",\n "version": "1.0.0"}', "broken.json": '{"kind": "Pod",',
+                 "configs.json": '{"apiVersion": "v1", "kind": "List", "items": [{"kind": "ConfigMap"}]}'}
+        for filename, content in files.items():
+            with open(os.path.join(self.folder, filename), "w") as f:
+                f.write(content)
+
+        cluster = YamlKImporter().Import(self.folder)
+        YamlKExporter()._export_objects(cluster.cluster_export_info)
+
+        for filename, content in files.items():
+            export_objects = [e for e in cluster.cluster_export_info if e.filename == filename]
+            self.assertEqual([e.kube_object for e in export_objects], [None])
+            with open(export_objects[0].out_fullname) as f:
+                self.assertEqual(f.read(), content)
@@ -0,0 +1,188 @@
+import copy
+from unittest import TestCase
+
+from microkure.exporter.export_object import ExportObject
+from microkure.kmodel.kube_cluster import KubeCluster
+from microkure.kmodel.kube_networking import KubeService
+from microkure.kmodel.kube_workload import KubePod
+from tests.data.kube_objects_dict import DEFAULT_SVC, POD_WITH_ONE_CONTAINER
+
+
+class TestKubeCluster(TestCase):
+
+    def setUp(self):
+        self.cluster = KubeCluster()
+        self.k_svc = KubeService(copy.deepcopy(DEFAULT_SVC))
+        self.k_pod = KubePod(copy.deepcopy(POD_WITH_ONE_CONTAINER))
+        self.cluster.add_object(self.k_svc)
+        self.cluster.add_object(self.k_pod)
+        self.cluster.add_export_object(ExportObject(self.k_pod, "pod.yaml"))
+
+    def test_collections_are_read_only(self):
+        self.assertEqual(self.cluster.cluster_objects, (self.k_svc, self.k_pod))
+
+        for collection in [self.cluster.cluster_objects, self.cluster.cluster_export_info,
+                           self.cluster.removed_export_info]:
+            with self.assertRaises(AttributeError):
+                collection.append(self.k_pod)
+
+        self.cluster.remove_object(self.k_pod)
+        self.assertEqual(self.cluster.cluster_objects, (self.k_svc,))
+        self.assertEqual(len(self.cluster.cluster_export_info), 0)
+
+    def test_name_lookup(self):
+        self.assertIs(self.cluster.get_object_by_name("test-pod-one-container"), self.k_pod)
+        self.assertIs(self.cluster.get_object_by_name("test-pod-one-container.default"), self.k_pod)
+        self.assertIs(self.cluster.get_object_by_name("test-pod-one-container.default.pod"), self.k_pod)
+        self.assertIs(self.cluster.get_object_by_name("test-svc.default.svc.cluster.local"), self.k_svc)
+        self.assertIs(self.cluster.get_object_by_typed_fullname("test-pod-one-container.default.pod"), self.k_pod)
+
+        container = self.k_pod.containers[0]
+        self.assertIs(self.cluster.get_object_by_name("container-a.test-pod-one-container.default.pod"), container)
+
+    def test_name_lookup_after_rename(self):
+        self.k_pod.set_name("renamed-pod")
+        self.assertIsNone(self.cluster.get_object_by_name("test-pod-one-container.default.pod"))
+        self.assertIs(self.cluster.get_object_by_name("renamed-pod.default.pod"), self.k_pod)
+        self.assertIs(self.cluster.get_object_by_name("container-a.renamed-pod.default.pod"), self.k_pod.containers[0])
+
+        self.k_pod.set_namespace("shop")
+        self.assertIsNone(self.cluster.get_object_by_name("renamed-pod.default"))
+        self.assertIs(self.cluster.get_object_by_name("renamed-pod.shop"), self.k_pod)
+        self.assertIs(self.cluster.get_object_by_typed_fullname("renamed-pod.shop.pod"), self.k_pod)
+        self.assertIs(self.cluster.get_object_by_name("container-a.renamed-pod.shop.pod"), self.k_pod.containers[0])
+
+    def test_name_lookup_after_set_containers(self):
+        container = copy.deepcopy(self.k_pod.containers[0].data)
+        container["name"] = "container-b"
+        self.k_pod.set_containers([container])
+
+        self.assertIsNone(self.cluster.get_object_by_name("container-a.test-pod-one-container.default.pod"))
+        self.assertIs(self.cluster.get_object_by_name("container-b.test-pod-one-container.default.pod"),
+                      self.k_pod.containers[0])
+
+    def test_name_lookup_after_remove(self):
+        self.cluster.remove_object(self.k_pod)
+        self.assertIsNone(self.cluster.get_object_by_name("test-pod-one-container"))
+        self.assertIsNone(self.cluster.get_object_by_name("container-a.test-pod-one-container.default.pod"))
+        self.assertIs(self.cluster.get_object_by_name("test-svc"), self.k_svc)
+
+    def test_duplicate_name(self):
+        k_svc = KubeService(copy.deepcopy(DEFAULT_SVC))
+        k_svc.set_namespace("shop")
+        self.cluster.add_object(k_svc)
+        self.assertIs(self.cluster.get_object_by_name("test-svc.shop"), k_svc)
+        with self.assertRaises(AttributeError):
+            self.cluster.get_object_by_name("test-svc")
+
+        # A renamed object no longer collides
+        k_svc.set_name("other-svc")
+        self.assertIs(self.cluster.get_object_by_name("test-svc"), self.k_svc)
+
+    def test_label_index_add_and_remove(self):
+        self.assertEqual(self.cluster.find_workload_selected_by_svc(self.k_svc), [])
+
+        k_pod = KubePod(copy.deepcopy(POD_WITH_ONE_CONTAINER))
+        k_pod.set_name("labeled-pod")
+        k_pod.set_labels({"app": "test"})
+        self.cluster.add_object(k_pod)
+        self.assertEqual(self.cluster.find_workload_selected_by_svc(self.k_svc), [k_pod])
+        self.assertEqual(self.cluster.find_svc_selecting_workload(k_pod), [self.k_svc])
+
+        self.cluster.remove_object(k_pod)
+        self.assertEqual(self.cluster.find_workload_selected_by_svc(self.k_svc), [])
+        self.cluster.remove_object(self.k_svc)
+        self.assertEqual(self.cluster.find_svc_selecting_workload(k_pod), [])
+
+    def test_label_index_relabel(self):
+        self.k_pod.set_labels({"app": "test"})
+        self.assertEqual(self.cluster.find_workload_selected_by_svc(self.k_svc), [self.k_pod])
+
+        self.k_svc.set_selectors({"app": "other"})
+        self.assertEqual(self.cluster.find_workload_selected_by_svc(self.k_svc), [])
+        self.assertEqual(self.cluster.find_svc_selecting_workload(self.k_pod), [])
+
+        self.k_pod.set_labels({"app": "other"})
+        self.assertEqual(self.cluster.find_workload_selected_by_svc(self.k_svc), [self.k_pod])
+
+        # Direct changes to data are seen once notified
+        self.k_pod.data["metadata"]["labels"] = {"app": "direct"}
+        self.k_pod.mark_modified()
+        self.assertEqual(self.cluster.find_workload_selected_by_svc(self.k_svc), [])
+
+    def test_label_index_multiple_labels(self):
+        k_pods = [KubePod(copy.deepcopy(POD_WITH_ONE_CONTAINER)) for _ in range(3)]
+        for i, (k_pod, labels) in enumerate(zip(k_pods, [{"app": "a"}, {"tier": "web"}, {"app": "a", "tier": "web"}])):
+            k_pod.set_name(f"pod-{i}")
+            k_pod.set_labels(labels)
+            self.cluster.add_object(k_pod)
+
+        self.k_svc.set_selectors({"app": "a", "tier": "web"})
+        self.assertEqual(self.cluster.find_workload_selected_by_svc(self.k_svc), k_pods)
+        self.assertEqual(self.cluster.find_svc_selecting_workload(k_pods[2]), [self.k_svc])
+
+    def test_label_pairs_do_not_collide(self):
+        self.k_pod.set_labels({"a": "b:c"})
+        self.k_svc.set_selectors({"a:b": "c"})
+        self.assertEqual(self.cluster.find_workload_selected_by_svc(self.k_svc), [])
+        self.assertFalse(self.k_svc.does_expose_workload(self.k_pod))
+
+    def _add_imported(self, kube_object, filename):
+        exp = ExportObject(kube_object, filename, source_path=f"kube/{filename}")
+        self.cluster.add_object(kube_object)
+        self.cluster.add_export_object(exp)
+        return exp
+
+    def test_export_info_indexes(self):
+        k_pod = KubePod(copy.deepcopy(POD_WITH_ONE_CONTAINER))
+        k_pod.set_name("other-pod")
+        k_pod.dirty = False
+        exp_pod = self._add_imported(k_pod, "pods.yaml")
+        exp_svc = self._add_imported(self.k_svc, "pods.yaml")
+
+        self.assertIs(self.cluster.get_exp_object(k_pod), exp_pod)
+        self.assertIs(self.cluster.get_exp_object(self.k_svc), exp_svc)
+        self.assertEqual(self.cluster.get_exp_objects_by_file(exp_pod.out_fullname), [exp_pod, exp_svc])
+
+        self.cluster.remove_export_object(exp_pod)
+        self.assertIsNone(self.cluster.get_exp_object(k_pod))
+        self.assertEqual(self.cluster.get_exp_objects_by_file(exp_pod.out_fullname), [exp_svc])
+        self.assertEqual(self.cluster.removed_export_info, (exp_pod,))
+        self.assertNotIn(exp_pod, self.cluster.cluster_export_info)
+
+        # Export info added again is no longer removed
+        self.cluster.add_export_object(exp_pod)
+        self.assertIs(self.cluster.get_exp_object(k_pod), exp_pod)
+        self.assertEqual(self.cluster.removed_export_info, ())
+
+        # Removing an object removes its export info
+        self.cluster.remove_object(self.k_svc)
+        self.assertIsNone(self.cluster.get_exp_object(self.k_svc))
+        self.assertEqual(self.cluster.get_exp_objects_by_file(exp_pod.out_fullname), [exp_pod])
+
+    def test_is_file_modified(self):
+        k_pod = KubePod(copy.deepcopy(POD_WITH_ONE_CONTAINER))
+        k_pod.set_name("other-pod")
+        k_pod.dirty = False
+        self.k_svc.dirty = False
+        exp_pod = self._add_imported(k_pod, "pods.yaml")
+        exp_svc = self._add_imported(self.k_svc, "svc.yaml")
+        self.assertFalse(self.cluster.is_file_modified(exp_pod.out_fullname))
+        self.assertFalse(self.cluster.is_file_modified(exp_svc.out_fullname))
+
+        # Modified object
+        k_pod.set_labels({"app": "test"})
+        self.assertTrue(self.cluster.is_file_modified(exp_pod.out_fullname))
+        self.assertFalse(self.cluster.is_file_modified(exp_svc.out_fullname))
+
+        # Removed object
+        self.cluster.remove_object(self.k_svc)
+        self.assertTrue(self.cluster.is_file_modified(exp_svc.out_fullname))
+
+        # Object without a source file
+        k_new = KubeService(copy.deepcopy(DEFAULT_SVC))
+        k_new.set_name("new-svc")
+        exp_new = ExportObject(k_new, "other.yaml")
+        self.cluster.add_object(k_new)
+        self.cluster.add_export_object(exp_new)
+        self.assertTrue(self.cluster.is_file_modified(exp_new.out_fullname))
@@ -0,0 +1,89 @@
+import copy
+from unittest import TestCase
+
+from microkure.kmodel.kube_istio import KubeVirtualService, KubeIstioGateway
+from microkure.kmodel.kube_networking import KubeService
+from microkure.kmodel.kube_workload import KubePod
+from tests.data.kube_objects_dict import DEFAULT_SVC, POD_WITH_ONE_CONTAINER
+
+
+class TestKubeObjectViews(TestCase):
+
+    # Not shared with other tests, which change the shared Istio objects in place
+    VIRTUAL_SERVICE = {
+        "kind": "VirtualService",
+        "metadata": {"name": "reviews"},
+        "spec": {
+            "hosts": ["host1"],
+            "http": [{"route": [{"destination": {"host": "destination1"}}], "timeout": "0.5s"},
+                     {"route": [{"destination": {"host": "destination2"}}], "timeout": "2s"}]
+        }
+    }
+    GATEWAY = {"kind": "Gateway", "metadata": {"name": "gateway"}, "spec": {"servers": [{"hosts": []}]}}
+
+    def test_virtual_service_views(self):
+        k_vs = KubeVirtualService(copy.deepcopy(self.VIRTUAL_SERVICE))
+        self.assertEqual(k_vs.destinations, ["destination1.default", "destination2.default"])
+        self.assertEqual(len(k_vs.timeouts), 2)
+
+        # Views are computed again once the direct change is notified
+        k_vs.data["spec"]["http"].append({"route": [{"destination": {"host": "destination3.other"}}], "timeout": "1s"})
+        k_vs.mark_modified()
+        self.assertEqual(k_vs.destinations, ["destination1.default", "destination2.default", "destination3.other"])
+        self.assertEqual(len(k_vs.timeouts), 3)
+
+        # Replacing data is a change too
+        k_vs.data = {"metadata": {"name": "empty"}, "spec": {}}
+        self.assertEqual(k_vs.destinations, [])
+        self.assertEqual(k_vs.timeouts, [])
+
+    def test_gateway_views(self):
+        k_gateway = KubeIstioGateway(copy.deepcopy(self.GATEWAY))
+        self.assertEqual(k_gateway.hosts_exposed, [])
+
+        k_gateway.data["spec"]["servers"][0]["hosts"].append("*/reviews")
+        k_gateway.mark_modified()
+        self.assertEqual(k_gateway.hosts_exposed, ["*/reviews"])
+
+    def test_service_port_keys(self):
+        k_svc = KubeService(copy.deepcopy(DEFAULT_SVC))
+        k_pod = KubePod(copy.deepcopy(POD_WITH_ONE_CONTAINER))
+        container = k_pod.containers[0]
+        self.assertTrue(k_svc.does_match_container(container))
+
+        k_svc.data["spec"]["ports"][0]["targetPort"] = 9000
+        k_svc.mark_modified()
+        self.assertFalse(k_svc.does_match_container(container))
+
+        k_svc.add_port({"name": "udp", "port": 8000, "protocol": "UDP", "targetPort": 8000})
+        self.assertTrue(k_svc.does_match_container(container))
+
+    def test_container_port_keys(self):
+        k_svc = KubeService(copy.deepcopy(DEFAULT_SVC))
+        k_pod = KubePod(copy.deepcopy(POD_WITH_ONE_CONTAINER))
+        container = k_pod.containers[0]
+        self.assertTrue(k_svc.does_match_container(container))
+
+        # Changes to the workload data are changes to its containers too
+        k_pod.data["spec"]["containers"][0]["ports"][1]["containerPort"] = 9000
+        k_pod.mark_modified()
+        self.assertIs(k_pod.containers[0], container)
+        self.assertFalse(k_svc.does_match_container(container))
+
+        new_container = copy.deepcopy(container.data)
+        new_container["ports"][1]["containerPort"] = 80
+        k_pod.set_containers([new_container])
+        self.assertTrue(k_svc.does_match_container(k_pod.containers[0]))
+
+    def test_identity(self):
+        k_pod = KubePod(copy.deepcopy(POD_WITH_ONE_CONTAINER))
+        container = k_pod.containers[0]
+        self.assertEqual(container.typed_fullname, "container-a.test-pod-one-container.default.pod")
+
+        k_pod.set_namespace("shop")
+        self.assertEqual(k_pod.typed_fullname, "test-pod-one-container.shop.pod")
+        self.assertEqual(container.typed_fullname, "container-a.test-pod-one-container.shop.pod")
+
+        k_pod.data["metadata"]["name"] = "direct"
+        k_pod.mark_modified()
+        self.assertEqual(container.fullname, "container-a.direct.shop")
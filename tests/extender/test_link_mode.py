@@ -0,0 +1,45 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from microkure.utils.utils import copy_file, LINK_MODES, COPY, HARDLINK, SYMLINK
+
+
+class TestLinkMode(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.source = os.path.join(self.folder, "chart.tgz")
+        with open(self.source, "wb") as f:
+            f.write(os.urandom(1024))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_same_content(self):
+        for mode in LINK_MODES:
+            destination = os.path.join(self.folder, mode)
+            copy_file(self.source, destination, mode)
+            self.assertEqual(self._read(destination), self._read(self.source))
+
+    def test_links(self):
+        copy_file(self.source, os.path.join(self.folder, COPY), COPY)
+        self.assertFalse(os.path.samefile(self.source, os.path.join(self.folder, COPY)))
+
+        copy_file(self.source, os.path.join(self.folder, HARDLINK), HARDLINK)
+        self.assertTrue(os.path.samefile(self.source, os.path.join(self.folder, HARDLINK)))
+
+        copy_file(self.source, os.path.join(self.folder, SYMLINK), SYMLINK)
+        self.assertTrue(os.path.islink(os.path.join(self.folder, SYMLINK)))
+
+    def test_fallback(self):
+        # Links cannot replace an existing file, which is overwritten by a copy
+        destination = os.path.join(self.folder, "existing")
+        open(destination, "w").close()
+        copy_file(self.source, destination, HARDLINK)
+        self.assertEqual(self._read(destination), self._read(self.source))
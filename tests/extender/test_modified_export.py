@@ -0,0 +1,86 @@
+import copy
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import yaml
+from microfreshener.core.model import MicroToscaModel
+
+from microkure import constants
+from microkure.exporter.export_object import ExportObject
+from microkure.exporter.yamlkexporter import YamlKExporter
+from microkure.importer.yamlkimporter import YamlKImporter
+from microkure.kmodel.kube_networking import KubeService
+from tests.data.kube_objects_dict import DEFAULT_SVC
+
+
+class TestModifiedExport(TestCase):
+
+    FILES = {
+        "pods.yaml": "# Pods\napiVersion: v1\nkind: Pod\nmetadata: {name: pod-a}\nspec:\n  containers: [{name: c, image: i}]\n"
+                     "---\napiVersion: v1\nkind: Pod\nmetadata: {name: pod-b}\nspec:\n  containers: [{name: c, image: i}]\n",
+        "svc.yaml": "apiVersion: v1\nkind: Service\nmetadata: {name: svc}   # service\nspec:\n  selector: {app: a}\n",
+        "README.txt": "Not a Kubernetes file\n",
+    }
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.kube_folder = os.path.join(self.folder, "kube")
+        os.makedirs(self.kube_folder)
+        for filename, content in self.FILES.items():
+            with open(os.path.join(self.kube_folder, filename), "w") as f:
+                f.write(content)
+        constants.set_output_root(os.path.join(self.folder, "out"))
+        self.cluster = YamlKImporter().Import(self.kube_folder)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+        constants.set_output_root("./out")
+
+    def _export(self) -> dict:
+        YamlKExporter(only_modified=True).export(self.cluster, MicroToscaModel("model"))
+        output = {}
+        for filename in self.FILES:
+            with open(os.path.join(constants.DEPLOY_OUTPUT_FOLDER, filename)) as f:
+                output[filename] = f.read()
+        return output
+
+    def _names(self, content: str) -> list:
+        return [d["metadata"]["name"] for d in yaml.safe_load_all(content) if d]
+
+    def test_untouched_files_are_copied(self):
+        self.assertEqual(self._export(), self.FILES)
+
+    def test_modified_object(self):
+        self.cluster.get_object_by_name("pod-b").set_host_network(True)
+        output = self._export()
+
+        self.assertNotEqual(output["pods.yaml"], self.FILES["pods.yaml"])
+        self.assertTrue(list(yaml.safe_load_all(output["pods.yaml"]))[1]["spec"]["hostNetwork"])
+        self.assertEqual(output["svc.yaml"], self.FILES["svc.yaml"])
+        self.assertEqual(output["README.txt"], self.FILES["README.txt"])
+
+    def test_added_object(self):
+        k_svc = KubeService(copy.deepcopy(DEFAULT_SVC))
+        self.cluster.add_object(k_svc)
+        self.cluster.add_export_object(ExportObject(k_svc, "svc.yaml"))
+        output = self._export()
+
+        self.assertEqual(self._names(output["svc.yaml"]), ["svc", "test-svc"])
+        self.assertEqual(output["pods.yaml"], self.FILES["pods.yaml"])
+
+    def test_removed_object(self):
+        self.cluster.remove_object(self.cluster.get_object_by_name("pod-a"))
+        output = self._export()
+
+        self.assertEqual(self._names(output["pods.yaml"]), ["pod-b"])
+        self.assertEqual(output["svc.yaml"], self.FILES["svc.yaml"])
+
+    def test_direct_change_is_exported_once_notified(self):
+        k_svc = self.cluster.get_object_by_name("svc")
+        k_svc.data["spec"]["type"] = "NodePort"
+        k_svc.mark_modified()
+        output = self._export()
+
+        self.assertEqual(yaml.safe_load(output["svc.yaml"])["spec"]["type"], "NodePort")
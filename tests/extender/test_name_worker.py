@@ -164,3 +164,24 @@ class TestNameWorker(TestCase):
 
         self.assertEqual(mr_ing.name, f"{k_ingress.fullname}.{KUBE_INGRESS}")
         self.assertEqual(mr_svc.name, f"{k_service.fullname}.{KUBE_SERVICE}")
+
+    def test_message_router_fqdn(self):
+        model = MicroToscaModel("test_message_router_fqdn")
+        cluster = KubeCluster()
+
+        k_service = KubeService(copy.deepcopy(DEFAULT_SVC))
+        cluster.add_object(k_service)
+
+        mr_svc = MessageRouter(f"{k_service.typed_fullname}.cluster.local")
+        mr_typed = MessageRouter(k_service.typed_fullname)
+        model.add_node(mr_svc)
+
+        extender: KubeExtender = KubeExtender([NAME_WORKER])
+        extender.extend(model, cluster)
+        self.assertEqual(mr_svc.name, k_service.typed_fullname)
+
+        # A typed name is only checked
+        model = MicroToscaModel("test_message_router_typed")
+        model.add_node(mr_typed)
+        KubeExtender([NAME_WORKER]).extend(model, cluster)
+        self.assertEqual(mr_typed.name, k_service.typed_fullname)
@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+from microkure.kmodel.names import NameKey, canonical_name, parse_name, qualify_name, name_has_namespace, \
+    name_is_FQDN
+
+
+class TestNames(TestCase):
+
+    def test_canonical_name(self):
+        self.assertEqual(canonical_name("cart.shop.svc.cluster.local"), "cart.shop.svc")
+        self.assertEqual(canonical_name("cart.shop.svc"), "cart.shop.svc")
+        self.assertEqual(canonical_name("cart"), "cart")
+
+        # Not a FQDN: there is neither name nor namespace before the shortname
+        self.assertEqual(canonical_name("svc.cluster.local"), "svc.cluster.local")
+        self.assertFalse(name_is_FQDN("svc.cluster.local"))
+        self.assertTrue(name_is_FQDN("cart.shop.svc.cluster.local"))
+
+    def test_parse_fqdn(self):
+        key = parse_name("cart.shop.svc.cluster.local")
+        self.assertEqual(key, NameKey("cart", "shop", "svc"))
+        self.assertEqual(key.fullname, "cart.shop")
+        self.assertEqual(key.typed_fullname, "cart.shop.svc")
+
+    def test_parse_typed_name(self):
+        self.assertEqual(parse_name("cart.shop.svc"), NameKey("cart", "shop", "svc"))
+        self.assertEqual(parse_name("cart.svc"), NameKey("cart", "", "svc"))
+
+        # Containers are named after their workload
+        key = parse_name("container-a.cart.shop.pod")
+        self.assertEqual(key, NameKey("container-a.cart", "shop", "pod"))
+        self.assertEqual(key.typed_fullname, "container-a.cart.shop.pod")
+
+    def test_parse_untyped_name(self):
+        self.assertEqual(parse_name("cart"), NameKey("cart", "", ""))
+        self.assertEqual(parse_name("cart").typed_fullname, "cart")
+        self.assertEqual(parse_name("cart.shop"), NameKey("cart", "shop", ""))
+        self.assertEqual(parse_name("cart.shop").fullname, "cart.shop")
+        self.assertEqual(parse_name("svc.cluster.local"), NameKey("svc.cluster", "local", ""))
+
+    def test_parse_is_memoized(self):
+        self.assertIs(parse_name("cart.shop.svc"), parse_name("cart.shop.svc"))
+        self.assertIs(parse_name("cart.shop.svc").name, parse_name("cart.shop.pod").name)
+
+    def test_qualify_name(self):
+        self.assertTrue(name_has_namespace("cart.shop"))
+        self.assertFalse(name_has_namespace("cart"))
+        self.assertEqual(qualify_name("cart", "shop"), "cart.shop")
+        self.assertEqual(qualify_name("cart.other", "shop"), "cart.other")
@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from microkure.utils.output_index import OutputIndex, set_output_index, write_output, copy_output, INDEX_FILENAME
+from microkure.utils.utils import publish_folder
+
+
+class TestOutputIndex(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.source = os.path.join(self.folder, "source.yaml")
+        with open(self.source, "w") as f:
+            f.write("kind: ConfigMap\n")
+
+    def tearDown(self):
+        set_output_index(None)
+        shutil.rmtree(self.folder)
+
+    def _run(self, name, report):
+        staging = os.path.join(self.folder, f".{name}.staging/")
+        os.makedirs(f"{staging}/deploy")
+
+        index = OutputIndex(self.folder, staging)
+        set_output_index(index)
+        write_output(f"{staging}/report.csv", report)
+        write_output(f"{staging}/deploy/model.yml", "name: model\n")
+        copy_output(self.source, f"{staging}/deploy/source.yaml")
+        set_output_index(None)
+
+        published = publish_folder(staging, os.path.join(self.folder, name))
+        index.save(published)
+        return published, index
+
+    def test_unchanged_files_are_linked(self):
+        first, index = self._run("first", "report 1\n")
+        self.assertEqual(index.reused, 0)
+        self.assertEqual(sorted(index.hashes), ["deploy/model.yml", "deploy/source.yaml", "report.csv"])
+        self.assertTrue(os.path.isfile(os.path.join(self.folder, INDEX_FILENAME)))
+
+        second, index = self._run("second", "report 2\n")
+        self.assertEqual(index.reused, 2)
+        for name in ["deploy/model.yml", "deploy/source.yaml"]:
+            self.assertTrue(os.path.samefile(f"{first}/{name}", f"{second}/{name}"))
+        self.assertFalse(os.path.samefile(f"{first}/report.csv", f"{second}/report.csv"))
+        with open(f"{second}/report.csv") as f:
+            self.assertEqual(f.read(), "report 2\n")
+        with open(f"{first}/report.csv") as f:
+            self.assertEqual(f.read(), "report 1\n")
+
+    def test_missing_previous_folder(self):
+        first, _ = self._run("first", "report\n")
+        shutil.rmtree(first)
+
+        second, index = self._run("second", "report\n")
+        self.assertEqual(index.reused, 0)
+        with open(f"{second}/deploy/model.yml") as f:
+            self.assertEqual(f.read(), "name: model\n")
@@ -0,0 +1,75 @@
+import copy
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from microkure import constants
+from microkure.exporter.export_object import ExportObject
+from microkure.kmodel.kube_networking import KubeService
+from microkure.report.messages import created_resource_msg
+from microkure.utils.utils import publish_folder
+from tests.data.kube_objects_dict import DEFAULT_SVC
+
+
+class TestOutputPublish(TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+        constants.set_output_root("./out")
+
+    def _write_output(self):
+        for folder in [constants.DEPLOY_OUTPUT_FOLDER, constants.REPORT_OUTPUT_FOLDER]:
+            os.makedirs(folder)
+            with open(f"{folder}/file.yaml", "w") as f:
+                f.write("key: value\n")
+
+    def test_output_root(self):
+        constants.set_output_root(self.folder, staging=True)
+        self.assertTrue(constants.DEPLOY_OUTPUT_FOLDER.startswith(self.folder))
+        self.assertNotEqual(os.path.normpath(constants.OUTPUT_FOLDER), constants.PUBLISHED_OUTPUT_FOLDER)
+
+        # Without staging, the output is written directly to its final folder
+        constants.set_output_root(self.folder)
+        self.assertEqual(os.path.normpath(constants.OUTPUT_FOLDER), constants.PUBLISHED_OUTPUT_FOLDER)
+
+    def test_publish(self):
+        constants.set_output_root(self.folder, staging=True)
+        self._write_output()
+
+        published = publish_folder(constants.OUTPUT_FOLDER, constants.PUBLISHED_OUTPUT_FOLDER)
+        self.assertEqual(published, constants.PUBLISHED_OUTPUT_FOLDER)
+        self.assertEqual(os.listdir(self.folder), [os.path.basename(published)])
+        self.assertEqual(sorted(os.listdir(published)), ["deploy", "report"])
+
+        # A second output with the same name does not replace the first one
+        self._write_output()
+        self.assertEqual(publish_folder(constants.OUTPUT_FOLDER, constants.PUBLISHED_OUTPUT_FOLDER), f"{published}-2")
+
+
+    def test_publish_concurrent(self):
+        constants.set_output_root(self.folder, staging=True)
+        self._write_output()
+
+        # The final folder is created by someone else after it has been checked
+        os.makedirs(f"{constants.PUBLISHED_OUTPUT_FOLDER}/deploy")
+        exists = os.path.exists
+        taken = constants.PUBLISHED_OUTPUT_FOLDER
+        with patch("os.path.exists", side_effect=lambda path: path != taken and exists(path)):
+            published = publish_folder(constants.OUTPUT_FOLDER, constants.PUBLISHED_OUTPUT_FOLDER)
+
+        self.assertEqual(published, f"{constants.PUBLISHED_OUTPUT_FOLDER}-2")
+        self.assertEqual(os.listdir(constants.PUBLISHED_OUTPUT_FOLDER), ["deploy"])
+        self.assertEqual(sorted(os.listdir(published)), ["deploy", "report"])
+
+    def test_report_paths(self):
+        constants.set_output_root(self.folder, staging=True)
+        k_svc = KubeService(copy.deepcopy(DEFAULT_SVC))
+        exp = ExportObject(k_svc, "svc.yaml")
+
+        # Paths do not point to the staging folder, which no longer exists once the output is published
+        self.assertTrue(created_resource_msg(k_svc, exp.out_fullname).endswith("(deploy/svc.yaml)"))
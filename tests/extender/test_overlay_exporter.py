@@ -0,0 +1,105 @@
+import copy
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from microkure import constants
+from microkure.exporter.export_object import ExportObject
+from microkure.exporter.overlay_exporter import OverlayKExporter, json_patch
+from microkure.importer.yamlkimporter import YamlKImporter
+from microkure.kmodel.kube_workload import KubePod
+from microkure.utils.utils import read_data_from_file
+
+
+def apply_patch(document, operations):
+    document = copy.deepcopy(document)
+    for operation in operations:
+        keys = [k.replace("~1", "/").replace("~0", "~") for k in operation["path"].split("/")[1:]]
+        parent = document
+        for key in keys[:-1]:
+            parent = parent[key]
+        if operation["op"] == "remove":
+            del parent[keys[-1]]
+        else:
+            parent[keys[-1]] = operation["value"]
+    return document
+
+
+class TestOverlayExporter(TestCase):
+
+    PODS = [
+        {"apiVersion": "v1", "kind": "Pod", "metadata": {"name": "pod-a"},
+         "spec": {"containers": [{"name": "container", "image": "image-a"}]}},
+        {"apiVersion": "v1", "kind": "Pod", "metadata": {"name": "pod-b", "namespace": "ns"},
+         "spec": {"containers": [{"name": "container", "image": "image-b",
+                                  "ports": [{"containerPort": 80, "hostPort": 80}]}]}},
+    ]
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        with open(os.path.join(self.folder, "pods.yaml"), "w") as f:
+            f.write("---\n".join(f"{p}\n" for p in self.PODS))
+        self.output_root = tempfile.mkdtemp()
+        constants.set_output_root(self.output_root)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+        shutil.rmtree(self.output_root)
+        constants.set_output_root("./out")
+
+    def _read_overlay(self, filename):
+        return read_data_from_file(f"{constants.OVERLAY_OUTPUT_FOLDER}/{filename}")
+
+    def test_json_patch(self):
+        original, current = self.PODS[1], copy.deepcopy(self.PODS[1])
+        current["metadata"]["labels"] = {"app.kubernetes.io/name": "b"}
+        current["spec"]["hostNetwork"] = True
+        del current["spec"]["containers"][0]["ports"][0]["hostPort"]
+
+        self.assertEqual(apply_patch(original, json_patch(original, current)), current)
+        self.assertEqual(json_patch(original, original), [])
+
+    def test_export(self):
+        cluster = YamlKImporter().Import(self.folder)
+        pod_a, pod_b = cluster.get_object_by_name("pod-a"), cluster.get_object_by_name("pod-b.ns")
+
+        pod_b.set_host_network(True)
+        cluster.remove_object(pod_a)
+        new_pod = KubePod(copy.deepcopy(self.PODS[0]))
+        new_pod.set_name("pod-c")
+        cluster.add_object(new_pod)
+        cluster.add_export_object(ExportObject(new_pod, None))
+
+        OverlayKExporter(self.folder)._export_cluster(cluster)
+
+        kustomization = self._read_overlay("kustomization.yaml")[0]
+        self.assertEqual(kustomization["resources"],
+                         [os.path.relpath(f"{self.folder}/pods.yaml", constants.OVERLAY_OUTPUT_FOLDER),
+                          "resources/pod-pod-c.yaml"])
+        self.assertEqual(self._read_overlay("resources/pod-pod-c.yaml"), [new_pod.data])
+
+        patch, deletion = kustomization["patches"]
+        self.assertEqual(patch["target"], {"version": "v1", "kind": "Pod", "name": "pod-b", "namespace": "ns"})
+        operations = self._read_overlay(patch["path"])[0]
+        self.assertEqual(apply_patch(self.PODS[1], operations), pod_b.data)
+
+        self.assertEqual(self._read_overlay(deletion["path"]),
+                         [{"apiVersion": "v1", "kind": "Pod", "metadata": {"name": "pod-a"}, "$patch": "delete"}])
+
+    def test_base_resources(self):
+        files = {"model.yml": "tosca_definitions_version: micro_tosca_yaml_1.1\ntopology_template: {}\n",
+                 "values.yaml": "kind: Values\nreplicas: 2\n",
+                 "config.yaml": "apiVersion: v1\nkind: ConfigMap\nmetadata: {name: config}\ndata: {key: value}\n"}
+        for filename, content in files.items():
+            with open(os.path.join(self.folder, filename), "w") as f:
+                f.write(content)
+
+        cluster = YamlKImporter().Import(self.folder)
+        OverlayKExporter(self.folder)._export_cluster(cluster)
+
+        # Only the files with Kubernetes objects are resources, other YAML files cannot be built by kustomize
+        resources = self._read_overlay("kustomization.yaml")[0]["resources"]
+        self.assertEqual(sorted(resources), sorted(os.path.relpath(f"{self.folder}/{filename}",
+                                                                   constants.OVERLAY_OUTPUT_FOLDER)
+                                                   for filename in ["pods.yaml", "config.yaml"]))
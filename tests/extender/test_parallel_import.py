@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from microkure import constants
+from microkure.exporter.yamlkexporter import YamlKExporter
+from microkure.importer.yamlkimporter import YamlKImporter
+
+
+class TestParallelImport(TestCase):
+
+    TEST_FILES_PATH_KUBE = os.path.join(os.path.dirname(__file__), "..", "..", "data", "examples")
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+        constants.set_output_root("./out")
+
+    def _import(self, name, workers):
+        # Output paths are set on import
+        constants.set_output_root(os.path.join(self.folder, name))
+        return YamlKImporter(workers=workers).Import(self.TEST_FILES_PATH_KUBE)
+
+    def _export(self, cluster, name) -> dict:
+        constants.set_output_root(os.path.join(self.folder, name))
+        YamlKExporter()._export_cluster(cluster)
+
+        files = {}
+        for path, _, filenames in os.walk(constants.DEPLOY_OUTPUT_FOLDER):
+            for filename in filenames:
+                with open(os.path.join(path, filename), "rb") as f:
+                    files[os.path.relpath(os.path.join(path, filename), constants.DEPLOY_OUTPUT_FOLDER)] = f.read()
+        return files
+
+    def test_same_order_and_export(self):
+        serial = self._import("serial", workers=1)
+        parallel = self._import("parallel", workers=2)
+        self.assertGreater(len(serial.services), 0)
+        self.assertGreater(len(serial.workloads), 0)
+
+        self.assertEqual([o.typed_fullname for o in parallel.cluster_objects],
+                         [o.typed_fullname for o in serial.cluster_objects])
+        self.assertEqual([(e.filename, e.document_index) for e in parallel.cluster_export_info],
+                         [(e.filename, e.document_index) for e in serial.cluster_export_info])
+
+        # Label lookups return objects in insertion order
+        for serial_svc, parallel_svc in zip(serial.services, parallel.services):
+            self.assertEqual([w.typed_fullname for w in parallel.find_workload_selected_by_svc(parallel_svc)],
+                             [w.typed_fullname for w in serial.find_workload_selected_by_svc(serial_svc)])
+        for serial_wl, parallel_wl in zip(serial.workloads, parallel.workloads):
+            self.assertEqual([s.typed_fullname for s in parallel.find_svc_selecting_workload(parallel_wl)],
+                             [s.typed_fullname for s in serial.find_svc_selecting_workload(serial_wl)])
+
+        serial_files = self._export(serial, "serial")
+        self.assertGreater(len(serial_files), 0)
+        self.assertEqual(self._export(parallel, "parallel"), serial_files)
@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from microkure.importer.parse_cache import ParseCache
+from microkure.utils.utils import read_data_from_file
+
+
+class TestParseCache(TestCase):
+
+    TEST_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "import_export_test_files", "deploy", "svc.yaml")
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.folder, "cache")
+        self.file = os.path.join(self.folder, "svc.yaml")
+        shutil.copy(self.TEST_FILE, self.file)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _entries(self):
+        return os.listdir(self.cache_dir)
+
+    def test_warm_read(self):
+        cache = ParseCache(self.cache_dir)
+
+        data = cache.read_data_from_file(self.file)
+        self.assertEqual(data, read_data_from_file(self.file))
+        self.assertEqual(len(self._entries()), 1)
+
+        # The file is not parsed again
+        with patch("microkure.importer.parse_cache.read_data_from_file") as parse:
+            self.assertEqual(ParseCache(self.cache_dir).read_data_from_file(self.file), data)
+            parse.assert_not_called()
+
+    def test_modified_file(self):
+        cache = ParseCache(self.cache_dir)
+        cache.read_data_from_file(self.file)
+
+        with open(self.file, "a") as f:
+            f.write("\n---\nkind: ConfigMap\nmetadata:\n  name: added\n")
+
+        data = cache.read_data_from_file(self.file)
+        self.assertEqual(data[-1]["metadata"]["name"], "added")
+        self.assertEqual(len(self._entries()), 2)
+
+    def test_eviction(self):
+        cache = ParseCache(self.cache_dir)
+        cache.read_data_from_file(self.file)
+        entry_size = os.path.getsize(os.path.join(self.cache_dir, self._entries()[0]))
+
+        for i in range(3):
+            with open(self.file, "a") as f:
+                f.write(f"\n---\nkind: ConfigMap\nmetadata:\n  name: added-{i}\n")
+            cache.read_data_from_file(self.file)
+        self.assertEqual(len(self._entries()), 4)
+
+        cache.max_size = entry_size * 2
+        cache.evict()
+        self.assertTrue(len(self._entries()) <= 2)
+        self.assertEqual(cache.read_data_from_file(self.file)[-1]["metadata"]["name"], "added-2")
@@ -135,8 +135,8 @@ class TestServiceExtender(TestCase):
         cluster.add_object(k_pod_2)
         cluster.add_object(k_pod_3)
 
-        k_pod_3.data["metadata"]["labels"] = label
-        k_svc.data["spec"]["selector"] = label
+        k_pod_3.set_labels(label)
+        k_svc.set_selectors(label)
 
         # Add Service to Tosca Model
         svc1 = Service(k_pod_1.containers[0].name + "." + k_pod_1.typed_fullname)
@@ -0,0 +1,73 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import yaml
+
+from microkure.exporter.export_object import file_content
+from microkure.importer.yamlkimporter import YamlKImporter
+
+
+class TestSourcePassthrough(TestCase):
+
+    PODS = """# Pods of the application
+apiVersion: v1
+kind: Pod   # first pod
+metadata:
+  name: pod-a
+  labels: {app: a}
+spec:
+  containers:
+  - name: container
+    image: image-a
+---
+apiVersion: v1
+kind: Pod
+metadata:
+  name: pod-b
+spec:
+  containers:
+  - name: container
+    image: image-b
+---
+# Not handled by microkure
+kind: ConfigMap
+metadata: {name: config}
+data:
+  key: &value value
+  other: *value
+"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        with open(os.path.join(self.folder, "pods.yaml"), "w") as f:
+            f.write(self.PODS)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _import(self):
+        cluster = YamlKImporter().Import(self.folder)
+        return cluster, [e for e in cluster.cluster_export_info if e.filename == "pods.yaml"]
+
+    def test_unmodified(self):
+        _, export_objects = self._import()
+        self.assertEqual(file_content(export_objects, preserve_source=True), self.PODS)
+
+    def test_modified(self):
+        cluster, export_objects = self._import()
+        cluster.get_object_by_name("pod-b").set_host_network(True)
+
+        content = file_content(export_objects, preserve_source=True)
+        self.assertEqual(list(yaml.safe_load_all(content)), [e.content for e in export_objects])
+        self.assertTrue(content.startswith(self.PODS[:self.PODS.index("---")]))
+        self.assertTrue(content.endswith(self.PODS[self.PODS.index("---\n# Not handled"):]))
+
+    def test_removed(self):
+        cluster, export_objects = self._import()
+        cluster.remove_object(cluster.get_object_by_name("pod-a"))
+        export_objects = export_objects[1:]
+
+        content = file_content(export_objects, preserve_source=True)
+        self.assertEqual(content, self.PODS[self.PODS.index("apiVersion: v1\nkind: Pod\n"):])
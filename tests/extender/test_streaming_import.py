@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from microkure.importer.document_reference import DocumentReference
+from microkure.importer.yamlkimporter import YamlKImporter
+from microkure.kmodel.kube_object import KubeObject
+
+
+class TestStreamingImport(TestCase):
+
+    TEST_FILES_PATH_KUBE = os.path.join(os.path.dirname(__file__), "..", "data", "import_export_test_files", "deploy")
+
+    def _as_data(self, imported):
+        if isinstance(imported, KubeObject):
+            return imported.data
+        if isinstance(imported, DocumentReference):
+            return imported.load()
+        return imported
+
+    def test_iter_objects(self):
+        cluster = YamlKImporter().Import(self.TEST_FILES_PATH_KUBE)
+        streamed = list(YamlKImporter().iter_objects(self.TEST_FILES_PATH_KUBE))
+
+        self.assertEqual([(self._as_data(e.kube_object), e.filename) for e in cluster.cluster_export_info],
+                         [(self._as_data(o), f) for o, f in streamed])
+
+    def test_unsupported_as_reference(self):
+        cluster = YamlKImporter().Import(self.TEST_FILES_PATH_KUBE)
+        ref_cluster = YamlKImporter(unsupported_as_reference=True).Import(self.TEST_FILES_PATH_KUBE)
+
+        self.assertEqual([o.data for o in cluster.cluster_objects], [o.data for o in ref_cluster.cluster_objects])
+        self.assertEqual(len(cluster.cluster_export_info), len(ref_cluster.cluster_export_info))
+
+        for expected, actual in zip(cluster.cluster_export_info, ref_cluster.cluster_export_info):
+            if isinstance(expected.kube_object, dict):
+                self.assertIsInstance(actual.kube_object, DocumentReference)
+            self.assertEqual(self._as_data(expected.kube_object), self._as_data(actual.kube_object))
+
+    def test_reference_offsets(self):
+        # Offsets are in bytes, also with multi-byte characters and CRLF line breaks
+        content = "kind: ConfigMap\r\nmetadata: {name: ünï}\r\ndata: {key: ✓}\r\n---\r\n" \
+                  "kind: Pod\r\nmetadata: {name: pod}\r\n---\r\n" \
+                  "kind: ConfigMap\r\nmetadata: {name: other}\r\ndata:\r\n  key: |\r\n    ✓ line\r\n    line\r\n"
+        folder = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(folder, "file.yaml"), "w", newline="") as f:
+                f.write(content)
+
+            streamed = list(YamlKImporter(unsupported_as_reference=True).iter_objects(folder))
+            references = [o for o, _ in streamed if isinstance(o, DocumentReference)]
+            self.assertEqual(len(references), 2)
+            self.assertEqual(references[0].load(), {"kind": "ConfigMap", "metadata": {"name": "ünï"},
+                                                    "data": {"key": "✓"}})
+            self.assertEqual(references[1].load()["metadata"], {"name": "other"})
+            self.assertEqual(references[1].load()["data"], {"key": "✓ line\nline\n"})
+            self.assertEqual(references[1].start, content.encode().index(b"kind: ConfigMap\r\nmetadata: {name: other}"))
+        finally:
+            shutil.rmtree(folder)
@@ -0,0 +1,42 @@
+import os
+from unittest import TestCase, skipUnless
+
+import yaml
+
+from microkure.utils.utils import dump_yaml, is_yaml
+
+
+@skipUnless(yaml.__with_libyaml__, "PyYAML has not been built against libyaml")
+class TestYamlBackend(TestCase):
+
+    TEST_FILES_PATH = os.path.join(os.path.dirname(__file__), "..", "data")
+
+    def _read_documents(self, loader):
+        documents = []
+        for folder, _, fnames in os.walk(self.TEST_FILES_PATH):
+            for file in sorted(fnames):
+                if is_yaml(file):
+                    with open(os.path.join(folder, file)) as f:
+                        documents += [d for d in yaml.load_all(f, Loader=loader) if d is not None]
+        self.assertGreater(len(documents), 0)
+        return documents
+
+    def test_loaders_equivalence(self):
+        self.assertEqual(self._read_documents(yaml.SafeLoader), self._read_documents(yaml.CSafeLoader))
+
+    def test_dumpers_equivalence(self):
+        documents = self._read_documents(yaml.SafeLoader)
+        documents.append({
+            "long": "long text with spaces " * 20 + "\n end",
+            "unicode": "ünïcode ✓",
+            "special": ["", "yes", "#comment", "key: value", "'quoted'", "a\tb"],
+        })
+
+        for document in documents:
+            self.assertEqual(dump_yaml(document, yaml.SafeDumper), dump_yaml(document, yaml.CSafeDumper))
+
+    def test_round_trip(self):
+        for document in self._read_documents(yaml.CSafeLoader):
+            dumped = dump_yaml(document, yaml.CSafeDumper)
+            self.assertEqual(yaml.load(dumped, Loader=yaml.SafeLoader), document)
+            self.assertEqual(yaml.load(dumped, Loader=yaml.CSafeLoader), document)